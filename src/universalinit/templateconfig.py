@@ -1,9 +1,45 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
+import os
+import re
 import yaml
 
+# Parse template configs with the libyaml C loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=32)
+def _compile_replacements(items: Tuple[Tuple[str, str], ...]) -> Tuple[re.Pattern, Dict[str, str], str]:
+    """Compile replacement keys into one pattern matching both `$KEY` and `{KEY}` forms.
+
+    Also returns the prefix shared by all keys (e.g. `KAVIA_`), which lets
+    callers skip texts that can't contain any placeholder.
+    """
+    tokens = {}
+    for key, value in items:
+        tokens[f"${key}"] = value
+        tokens[f"{{{key}}}"] = value
+    # Longest tokens first, so a key that is a prefix of another one can't shadow it
+    alternatives = sorted(tokens, key=len, reverse=True)
+    pattern = re.compile("|".join(re.escape(token) for token in alternatives))
+    return pattern, tokens, os.path.commonprefix([key for key, _ in items])
+
+
+def apply_replacements(text: str, replacements: Dict[str, Any]) -> str:
+    """Replace `$KEY` and `{KEY}` placeholders in text in a single pass."""
+    if not replacements:
+        return text
+    pattern, tokens, key_prefix = _compile_replacements(
+        tuple((key, str(value)) for key, value in replacements.items())
+    )
+    # Most template files contain no placeholder at all, a substring check is much cheaper than a scan
+    if key_prefix not in text:
+        return text
+    return pattern.sub(lambda match: tokens[match.group(0)], text)
+
 
 class ProjectType(Enum):
     """Supported project types."""
@@ -103,12 +139,7 @@ class ProjectConfig:
 
     def replace_parameters(self, content: str) -> str:
         """Replace parameters in content."""
-        replacements = self.get_replaceable_parameters()
-        for key, value in replacements.items():
-            str_value = str(value)
-            content = content.replace(f"${key}", str_value)
-            content = content.replace(f"{{{key}}}", str_value)
-        return content
+        return apply_replacements(content, self.get_replaceable_parameters())
 
 
 @dataclass
@@ -198,7 +229,7 @@ class TemplateConfigProvider:
             data = f.read()
             data = self.project_config.replace_parameters(data)
 
-            config_data = yaml.safe_load(data)
+            config_data = yaml.load(data, Loader=_YamlLoader)
 
         return TemplateInitInfo(
             configure_environment=ConfigureEnvironment(
@@ -1,14 +1,20 @@
 import os
 import subprocess
 import tempfile
+import threading
 import time
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import IO, Callable, Dict, List, Optional, Union
 from pathlib import Path
-import json
 
-from .templateconfig import TemplateConfigProvider, TemplateInitInfo, ProjectType, ProjectConfig
+try:
+    # orjson parses JSON considerably faster; fall back to the stdlib parser if it's not installed
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from .templateconfig import TemplateConfigProvider, TemplateInitInfo, ProjectType, ProjectConfig, apply_replacements
 
 class ProcessingStep(Enum):
     """Enum for processing steps."""
@@ -41,6 +47,9 @@ class ProjectTemplate(ABC):
         self.template_provider = template_provider
         self.template_path = template_provider.get_template_path(config.project_type)
         self.config_provider = TemplateConfigProvider(self.template_path, self.config)
+        # Set once the background post-processing process started by this template exits
+        self._post_process_done: Optional[threading.Event] = None
+        self._post_process_hooks: List[Callable[[bool], None]] = []
 
     @abstractmethod
     def validate_parameters(self) -> bool:
@@ -100,6 +109,18 @@ class ProjectTemplate(ABC):
         init_info = self.get_init_info()
         if init_info.post_processing and init_info.post_processing.script:
             self._run_processing_script(init_info.post_processing.script, ProcessingStep.POST_PROCESSING)
+        else:
+            # Nothing runs in the background, so post-processing is trivially done
+            self._run_post_process_hooks(True)
+
+    def register_post_process_hook(self, hook: Callable[[bool], None]) -> None:
+        """Register a callable to run when background post-processing finishes.
+
+        The hook is called from a watcher thread with True if post-processing
+        succeeded, False otherwise. Without a post-processing script it is
+        called with True as soon as the project is generated.
+        """
+        self._post_process_hooks.append(hook)
 
     def wait_for_post_process_completed(self, timeout: int = 30) -> bool:
         """Wait for post-processing completion with a timeout.
@@ -116,7 +137,14 @@ class ProjectTemplate(ABC):
         init_info = self.get_init_info()
         if not (init_info.post_processing and init_info.post_processing.script):
             return True
-            
+
+        # If this template started the process, block until it exits instead of polling;
+        # the wrapper writes its final status before exiting
+        if self._post_process_done is not None:
+            if not self._post_process_done.wait(timeout):
+                return False
+            return status_file.exists() and status_file.read_text().strip() == "SUCCESS"
+
         start_time = time.time()
         while time.time() - start_time < timeout:
             if status_file.exists():
@@ -205,6 +233,11 @@ rm -f "$0"
                         stdin=subprocess.DEVNULL,
                         start_new_session=True
                     )
+
+                self._post_process_done = threading.Event()
+                threading.Thread(
+                    target=self._watch_post_process, args=(res, self._post_process_done), daemon=True
+                ).start()
                 
             else:
                 # For pre-processing, run synchronously
@@ -235,6 +268,24 @@ rm -f "$0"
                 # For post-processing failures in background mode, the wrapper script will handle it
                 pass
 
+    def _watch_post_process(self, process: subprocess.Popen, done: threading.Event) -> None:
+        """Reap the background post-processing process, run the hooks and signal completion."""
+        process.wait()
+        try:
+            status_file = self.config.output_path / "post_process_status.lock"
+            success = status_file.exists() and status_file.read_text().strip() == "SUCCESS"
+            self._run_post_process_hooks(success)
+        finally:
+            done.set()
+
+    def _run_post_process_hooks(self, success: bool) -> None:
+        """Call each registered post-processing hook, reporting hook failures without raising."""
+        for hook in self._post_process_hooks:
+            try:
+                hook(success)
+            except Exception as e:
+                print(f"Post-processing hook failed: {str(e)}")
+
 class ProjectTemplateFactory:
     """Factory for creating project templates."""
 
@@ -298,9 +349,28 @@ class ProjectInitializer:
         self.template_factory.register_template(ProjectType.LIGHTNINGJS, LightningjsTemplate)
         self.template_factory.register_template(ProjectType.TIZEN, TizenTemplate)
         self.template = None
+        self._post_process_hooks: List[Callable[[bool], None]] = []
+
+    def reset(self) -> None:
+        """Forget the previously initialized project and its hooks, so the initializer can be reused."""
+        self.template = None
+        self._post_process_hooks = []
+
+    def register_post_process_hook(self, hook: Callable[[bool], None]) -> None:
+        """Register a callable to run when post-processing of an initialized project finishes.
+
+        Hooks apply to projects initialized after registration, until reset().
+        Each is called from a watcher thread with True if post-processing
+        succeeded, False otherwise, or with True right away if the template
+        has no post-processing script.
+        """
+        self._post_process_hooks.append(hook)
+
     def initialize_project(self, config: ProjectConfig) -> bool:
         """Initialize a project using the appropriate template."""
         self.template = self.template_factory.create_template(config)
+        for hook in self._post_process_hooks:
+            self.template.register_post_process_hook(hook)
         
         return self.template.initialize()
 
@@ -318,19 +388,26 @@ class ProjectInitializer:
         return self.template.wait_for_post_process_completed(timeout)
 
     @staticmethod
-    def load_config(config_path: Path) -> ProjectConfig:
-        """Load project configuration from a JSON file."""
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
-            return ProjectConfig(
-                name=config_data['name'],
-                version=config_data['version'],
-                description=config_data['description'],
-                author=config_data['author'],
-                project_type=ProjectType.from_string(config_data['project_type']),
-                output_path=Path(config_data['output_path']),
-                parameters=config_data.get('parameters', {})
-            )
+    def load_config(config_path: Union[Path, str, IO]) -> ProjectConfig:
+        """Load project configuration from a JSON file.
+
+        Args:
+            config_path: Path to the JSON file, or an already open file object to read it from
+        """
+        if hasattr(config_path, 'read'):
+            config_data = json_loads(config_path.read())
+        else:
+            with open(config_path, 'rb') as f:
+                config_data = json_loads(f.read())
+        return ProjectConfig(
+            name=config_data['name'],
+            version=config_data['version'],
+            description=config_data['description'],
+            author=config_data['author'],
+            project_type=ProjectType.from_string(config_data['project_type']),
+            output_path=Path(config_data['output_path']),
+            parameters=config_data.get('parameters', {})
+        )
 
 
 class AndroidTemplate(ProjectTemplate):
@@ -1120,19 +1197,12 @@ class FileSystemHelper:
     @staticmethod
     def _apply_replacements(text: str, replacements: Dict[str, str]) -> str:
         """Apply variable replacements to text."""
-        for key, value in replacements.items():
-            text = text.replace(f"${key}", str(value))
-            text = text.replace(f"{{{key}}}", str(value))
-        return text
+        return apply_replacements(text, replacements)
 
     @staticmethod
     def _apply_path_replacements(path: Path, replacements: Dict[str, str]) -> Path:
         """Apply variable replacements to file path."""
-        path_str = str(path)
-        for key, value in replacements.items():
-            path_str = path_str.replace(f"${key}", str(value))
-            path_str = path_str.replace(f"{{{key}}}", str(value))
-        return Path(path_str)
+        return Path(apply_replacements(str(path), replacements))
 
     @staticmethod
     def _copy_file(src: Path, dst: Path, replacements: Dict[str, str]) -> None:
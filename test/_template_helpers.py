@@ -0,0 +1,62 @@
+"""Helpers shared by the template test modules.
+
+The template test modules follow a common layout:
+
+- Some modules keep the invariant ProjectConfig fields in a BASE_PROJECT_CONFIG
+  constant with read-only parameters, and derive each test's copy from it with
+  dataclasses.replace. The others build ProjectConfig directly in their
+  project_config fixture.
+- TEMPLATE_DIRS and TEMPLATE_FILES describe the mock template tree. File bodies
+  are pre-encoded bytes, so the template_dir fixture only has to write them.
+- CONFIG is the mock config.yml. Paths that depend on where the template ends
+  up are written as a TEMPLATE_PATH sentinel. The config is serialized once with
+  dump_config, and create_template_root swaps in the real template path.
+
+Mock config.yml files are serialized as JSON: the library's YAML loader reads
+JSON just the same, and the json module is far cheaper to import and emit with
+than PyYAML.
+"""
+import json
+
+try:
+    # orjson serializes considerably faster; fall back to the stdlib encoder if it's not installed
+    from orjson import dumps as _json_dumps
+except ImportError:
+    def _json_dumps(data):
+        return json.dumps(data).encode()
+
+
+# Post-processing script that leaves a marker file in the generated project
+MARKER_SCRIPT = "#!/bin/bash\ntouch {KAVIA_PROJECT_DIRECTORY}/post_processing_executed\n"
+
+
+def dump_config(config, post_script=None):
+    """Serialize a mock config.yml, optionally with a different post-processing script."""
+    if post_script is not None:
+        config = {**config, 'post_processing': {'script': post_script}}
+    return json.dumps(config)
+
+
+def requested_post_script(request):
+    """Return the `post_script` passed to a template_dir fixture through indirect parametrization."""
+    return getattr(request, 'param', {}).get('post_script')
+
+
+def create_template_root(tmp_path_factory, name, config_yml, path_sentinel=None):
+    """Create `<root>/templates/<name>/config.yml` and return the `<name>` template directory.
+
+    Occurrences of `path_sentinel` in config_yml are replaced with that directory's path. The
+    sentinel sits inside a JSON string, so the path is JSON-escaped the same way; backslashes
+    in Windows paths would otherwise be read as escape sequences.
+    """
+    template_path = tmp_path_factory.mktemp(name) / "templates" / name
+    template_path.mkdir(parents=True)
+    if path_sentinel is not None:
+        config_yml = config_yml.replace(path_sentinel, json.dumps(str(template_path))[1:-1])
+    (template_path / "config.yml").write_text(config_yml)
+    return template_path
+
+
+def dump_json(data):
+    """Serialize data to JSON bytes, e.g. for a project config passed to ProjectInitializer.load_config."""
+    return _json_dumps(data)
@@ -1,7 +1,6 @@
 import time
 import pytest
 from pathlib import Path
-import shutil
 import tempfile
 import yaml
 import os
@@ -16,9 +15,8 @@ from universalinit.universalinit import (
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test outputs."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_path:
+        yield Path(temp_path)
 
 
 @pytest.fixture
@@ -12,14 +12,8 @@ from universalinit.universalinit import ProjectInitializer, TemplateProvider, As
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test outputs."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    try:
-        # Use ignore_errors=True to handle directories that might have read-only files
-        shutil.rmtree(temp_path, ignore_errors=True)
-    except OSError:
-        # If that still fails, log the error but don't fail the test
-        print(f"Warning: Could not remove temporary directory {temp_path}")
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_path:
+        yield Path(temp_path)
 
 
 @pytest.fixture
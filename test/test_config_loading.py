@@ -0,0 +1,93 @@
+import io
+import pytest
+from collections import namedtuple
+from pathlib import Path
+
+from universalinit.templateconfig import ProjectType
+from universalinit.universalinit import ProjectInitializer
+
+from _template_helpers import dump_json
+
+
+# One entry per template whose JSON config loading used to be tested in its own module
+Variant = namedtuple('Variant', 'project_type parameters')
+
+VARIANTS = [
+    Variant(ProjectType.NEXTJS, {
+        "typescript": True,
+        "styling_solution": "tailwind"
+    }),
+    Variant(ProjectType.NUXT, {}),
+    Variant(ProjectType.POSTGRESQL, {
+        "database_name": "json_db",
+        "database_user": "jsonuser",
+        "database_password": "jsonpass",
+        "database_port": 15433
+    }),
+    Variant(ProjectType.QWIK, {}),
+    Variant(ProjectType.REACT_NATIVE, {}),
+    Variant(ProjectType.REMIX, {
+        "typescript": True,
+        "styling_solution": "tailwind"
+    }),
+    Variant(ProjectType.REMOTION, {}),
+    Variant(ProjectType.SLIDEV, {}),
+    Variant(ProjectType.SQLITE, {
+        "database_name": "config_test.db"
+    }),
+    Variant(ProjectType.TYPESCRIPT, {}),
+    Variant(ProjectType.VITE, {
+        "typescript": True,
+        "framework": "vue"
+    }),
+    Variant(ProjectType.VUE, {}),
+]
+
+
+def encode_config(variant, config_root):
+    """Return the JSON project configuration for a variant, with its output under config_root."""
+    return dump_json({
+        "name": "json-config-test",
+        "version": "1.0.0",
+        "description": "Test from JSON config",
+        "author": "Test Author",
+        "project_type": variant.project_type.value,
+        "output_path": str(config_root / variant.project_type.value / "output"),
+        "parameters": variant.parameters
+    })
+
+
+@pytest.fixture(scope="session")
+def json_config_files(tmp_path_factory):
+    """Write one JSON project configuration per variant, once for the whole session."""
+    config_root = tmp_path_factory.mktemp("json-configs")
+    config_files = {}
+    for variant in VARIANTS:
+        config_file = config_root / f"{variant.project_type.value}.json"
+        config_file.write_bytes(encode_config(variant, config_root))
+        config_files[variant.project_type] = config_file
+    return config_files
+
+
+@pytest.mark.parametrize('variant', VARIANTS, ids=lambda variant: variant.project_type.value)
+def test_config_file_loading(json_config_files, variant):
+    """Test loading project configuration from JSON file."""
+    config_file = json_config_files[variant.project_type]
+
+    config = ProjectInitializer.load_config(config_file)
+    assert config.name == "json-config-test"
+    assert config.project_type == variant.project_type
+    assert config.output_path == config_file.parent / variant.project_type.value / "output"
+    assert config.parameters == variant.parameters
+
+
+@pytest.mark.parametrize('variant', VARIANTS, ids=lambda variant: variant.project_type.value)
+def test_config_stream_loading(variant):
+    """Test loading project configuration from an in-memory JSON stream."""
+    config_root = Path("configs")
+
+    config = ProjectInitializer.load_config(io.BytesIO(encode_config(variant, config_root)))
+    assert config.name == "json-config-test"
+    assert config.project_type == variant.project_type
+    assert config.output_path == config_root / variant.project_type.value / "output"
+    assert config.parameters == variant.parameters
@@ -1,6 +1,5 @@
 import pytest
 from pathlib import Path
-import shutil
 import tempfile
 import yaml
 import json
@@ -12,9 +11,8 @@ from universalinit.universalinit import ProjectInitializer, TemplateProvider, Fa
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test outputs."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_path:
+        yield Path(temp_path)
 
 
 @pytest.fixture
@@ -1,6 +1,5 @@
 import pytest
 from pathlib import Path
-import shutil
 import tempfile
 import yaml
 import json
@@ -13,9 +12,8 @@ from universalinit.universalinit import ProjectInitializer, TemplateProvider, Re
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test outputs."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_path:
+        yield Path(temp_path)
 
 
 @pytest.fixture
@@ -138,6 +136,19 @@ def test_get_entry_point_url(template_dir, project_config):
     
     assert entry_point_url == "http://localhost:3000"
 
+
+def test_reset_forgets_initialized_project(template_dir, project_config):
+    """Test that a reset initializer no longer refers to the previous project."""
+    initializer = ProjectInitializer()
+    initializer.template_factory.template_provider = TemplateProvider(template_dir)
+    initializer.template = initializer.template_factory.create_template(project_config)
+
+    initializer.reset()
+
+    assert initializer.template is None
+    with pytest.raises(ValueError):
+        initializer.wait_for_post_process_completed()
+
 def test_missing_required_parameters(template_dir):
     """Test initialization with missing required parameters."""
     config = ProjectConfig(
@@ -184,6 +195,54 @@ def test_post_processing_execution(template_dir, project_config, temp_dir):
     assert marker_path.exists()
 
 
+def test_failed_post_processing_is_reported(template_dir, project_config):
+    """Test that waiting on a failing post-processing script reports the failure."""
+    config_path = template_dir / "react" / "config.yml"
+    with open(config_path, 'r') as f:
+        config = yaml.safe_load(f)
+
+    config['post_processing']['script'] = "#!/bin/bash\nexit 3\n"
+
+    with open(config_path, 'w') as f:
+        yaml.dump(config, f)
+
+    initializer = ProjectInitializer()
+    initializer.template_factory.template_provider = TemplateProvider(template_dir)
+    initializer.template_factory.register_template(ProjectType.REACT, ReactTemplate)
+    results = []
+    initializer.register_post_process_hook(results.append)
+
+    success = initializer.initialize_project(project_config)
+    assert success
+    assert not initializer.wait_for_post_process_completed(timeout=10)
+    assert (project_config.output_path / "post_process_status.lock").read_text().strip() == "FAILED"
+    # Hooks have run by the time the wait returns
+    assert results == [False]
+
+
+def test_post_process_hooks_run_without_script(template_dir, project_config):
+    """Test that hooks report success when the template has no post-processing script."""
+    config_path = template_dir / "react" / "config.yml"
+    with open(config_path, 'r') as f:
+        config = yaml.safe_load(f)
+
+    config.pop('post_processing', None)
+
+    with open(config_path, 'w') as f:
+        yaml.dump(config, f)
+
+    initializer = ProjectInitializer()
+    initializer.template_factory.template_provider = TemplateProvider(template_dir)
+    initializer.template_factory.register_template(ProjectType.REACT, ReactTemplate)
+    results = []
+    initializer.register_post_process_hook(results.append)
+
+    success = initializer.initialize_project(project_config)
+    assert success
+    assert results == [True]
+    assert initializer.wait_for_post_process_completed()
+
+
 def test_config_file_loading(temp_dir):
     """Test loading project configuration from JSON file."""
     config_data = {
@@ -337,3 +396,19 @@ def test_extra_files_with_binary_content(template_dir, project_config, temp_dir)
     copied_binary = project_config.output_path / "logo.png"
     assert copied_binary.exists()
     assert copied_binary.read_bytes() == extra_binary.read_bytes()
+
+
+def test_replacements_applied_in_single_pass():
+    """Test that both placeholder forms are replaced and overlapping keys don't clash."""
+    replacements = {
+        'KAVIA_DB_NAME': 'mydb',
+        'KAVIA_DB_NAME_SUFFIX': 'suffix',
+        'KAVIA_DB_PORT': 5432,
+    }
+    text = "{KAVIA_DB_NAME} $KAVIA_DB_NAME_SUFFIX {KAVIA_DB_PORT} {KAVIA_UNKNOWN}"
+
+    assert FileSystemHelper._apply_replacements(text, replacements) == "mydb suffix 5432 {KAVIA_UNKNOWN}"
+    assert FileSystemHelper._apply_replacements(text, {}) == text
+    assert FileSystemHelper._apply_path_replacements(
+        Path("{KAVIA_DB_NAME}/$KAVIA_DB_NAME_SUFFIX.sql"), replacements
+    ) == Path("mydb/suffix.sql")
@@ -1,103 +1,111 @@
 import pytest
+from dataclasses import replace
 from pathlib import Path
-import shutil
-import tempfile
-import yaml
-import json
+from types import MappingProxyType
 
 from universalinit.templateconfig import ProjectConfig, ProjectType, TemplateInitInfo
-from universalinit.universalinit import ProjectInitializer, TemplateProvider, RemixTemplate
-
-
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test outputs."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+from universalinit.universalinit import RemixTemplate
+
+from _template_helpers import MARKER_SCRIPT, create_template_root, dump_config, requested_post_script
+
+
+BASE_PROJECT_CONFIG = ProjectConfig(
+    name="test-remix-app",
+    version="1.0.0",
+    description="Test Remix Application",
+    author="Test Author",
+    project_type=ProjectType.REMIX,
+    output_path=Path("output"),
+    parameters=MappingProxyType({
+        "typescript": True,
+        "styling_solution": "tailwind"
+    })
+)
+
+
+# Mock template tree matching Remix's structure
+TEMPLATE_DIRS = ("app/routes",)
+TEMPLATE_FILES = {
+    "app/root.tsx": b"// ${KAVIA_TEMPLATE_PROJECT_NAME}",
+    "app/routes/_index.tsx": b"export default function Index() { return <h1>${KAVIA_TEMPLATE_PROJECT_NAME}</h1>; }",
+    "package.json": b'{"name": "${KAVIA_TEMPLATE_PROJECT_NAME}"}',
+    "tailwind.config.ts": b'// Tailwind config for ${KAVIA_TEMPLATE_PROJECT_NAME}',
+}
+
+
+TEMPLATE_PATH = "__REMIX_PATH__"
+CONFIG = {
+    'configure_environment': {
+        'command': 'npm install',
+        'working_directory': TEMPLATE_PATH
+    },
+    'build_cmd': {
+        'command': 'npm install && npm run build',
+        'working_directory': TEMPLATE_PATH
+    },
+    'install_dependencies': {
+        'command': 'npm install',
+        'working_directory': TEMPLATE_PATH
+    },
+    'env': {
+        'environment_initialized': True,
+        'node_version': '18.19.1',
+        'npm_version': '9.2.0'
+    },
+    'init_files': [],
+    'init_minimal': 'Minimal Remix application initialized',
+    'run_tool': {
+        'command': 'npm run dev',
+        'working_directory': TEMPLATE_PATH
+    },
+    'test_tool': {
+        'command': 'npm test',
+        'working_directory': TEMPLATE_PATH
+    },
+    'init_style': '',
+    'linter': {
+        'script_content': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\nnpx eslint "$@"'
+    },
+    'post_processing': {
+        'script': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\nnpm install'
+    }
+}
 
 
-@pytest.fixture
-def template_dir(temp_dir):
-    """Create a mock template directory with necessary files."""
-    templates_path = temp_dir / "templates"
-    remix_path = templates_path / "remix"
-    remix_path.mkdir(parents=True)
+@pytest.fixture(scope="session")
+def template_dir(request, tmp_path_factory):
+    """Create a mock template directory with necessary files.
 
+    The directory is shared by the whole session, so tests must not modify it.
+    Tests can pass `{'post_script': ...}` through indirect parametrization to
+    get a separate template with a different post-processing script.
+    """
     # Create mock config.yml
-    config = {
-        'configure_environment': {
-            'command': 'npm install',
-            'working_directory': str(remix_path)
-        },
-        'build_cmd': {
-            'command': 'npm install && npm run build',
-            'working_directory': str(remix_path)
-        },
-        'install_dependencies': {
-            'command': 'npm install',
-            'working_directory': str(remix_path)
-        },
-        'env': {
-            'environment_initialized': True,
-            'node_version': '18.19.1',
-            'npm_version': '9.2.0'
-        },
-        'init_files': [],
-        'init_minimal': 'Minimal Remix application initialized',
-        'run_tool': {
-            'command': 'npm run dev',
-            'working_directory': str(remix_path)
-        },
-        'test_tool': {
-            'command': 'npm test',
-            'working_directory': str(remix_path)
-        },
-        'init_style': '',
-        'linter': {
-            'script_content': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\nnpx eslint "$@"'
-        },
-        'post_processing': {
-            'script': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\nnpm install'
-        }
-    }
-
-    with open(remix_path / "config.yml", 'w') as f:
-        yaml.dump(config, f)
+    config_yml = dump_config(CONFIG, requested_post_script(request))
+    remix_path = create_template_root(tmp_path_factory, "remix", config_yml, TEMPLATE_PATH)
 
-    # Create some mock template files
-    (remix_path / "app").mkdir()
-    (remix_path / "app" / "root.tsx").write_text("// ${KAVIA_TEMPLATE_PROJECT_NAME}")
-    (remix_path / "app" / "routes").mkdir()
-    (remix_path / "app" / "routes" / "_index.tsx").write_text("export default function Index() { return <h1>${KAVIA_TEMPLATE_PROJECT_NAME}</h1>; }")
-    (remix_path / "package.json").write_text('{"name": "${KAVIA_TEMPLATE_PROJECT_NAME}"}')
-    (remix_path / "tailwind.config.ts").write_text('// Tailwind config for ${KAVIA_TEMPLATE_PROJECT_NAME}')
+    # Create some mock template files that match Remix's structure
+    for directory in TEMPLATE_DIRS:
+        (remix_path / directory).mkdir(parents=True, exist_ok=True)
+    for relative_path, content in TEMPLATE_FILES.items():
+        (remix_path / relative_path).write_bytes(content)
 
-    return templates_path
+    return remix_path.parent
 
 
 @pytest.fixture
-def project_config(temp_dir):
+def project_config(tmp_path):
     """Create a test project configuration."""
-    return ProjectConfig(
-        name="test-remix-app",
-        version="1.0.0",
-        description="Test Remix Application",
-        author="Test Author",
-        project_type=ProjectType.REMIX,
-        output_path=temp_dir / "output",
-        parameters={
-            "typescript": True,
-            "styling_solution": "tailwind"
-        }
+    return replace(
+        BASE_PROJECT_CONFIG,
+        output_path=tmp_path / "output",
+        parameters=dict(BASE_PROJECT_CONFIG.parameters),
     )
 
 
-def test_remix_init_info(template_dir, project_config):
+def test_remix_init_info(template_dir, project_config, initializer_factory):
     """Test that getting template init info works correctly."""
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.REMIX, RemixTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.REMIX, RemixTemplate)
     template = initializer.template_factory.create_template(project_config)
     
     init_info = template.get_init_info()
@@ -107,11 +115,10 @@ def test_remix_init_info(template_dir, project_config):
     assert init_info.configure_environment.command == 'npm install'
 
 
-def test_project_initialization(template_dir, project_config):
+@pytest.mark.usefixtures("no_post_processing")
+def test_project_initialization(template_dir, project_config, initializer_factory):
     """Test basic project initialization."""
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.REMIX, RemixTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.REMIX, RemixTemplate)
 
     success = initializer.initialize_project(project_config)
     assert success
@@ -125,114 +132,40 @@ def test_project_initialization(template_dir, project_config):
     assert (output_dir / "tailwind.config.ts").exists()
 
     # Verify content replacement
-    root_content = (output_dir / "app" / "root.tsx").read_text()
-    assert "test-remix-app" in root_content
+    root_content = (output_dir / "app" / "root.tsx").read_bytes()
+    assert b"test-remix-app" in root_content
 
-    index_content = (output_dir / "app" / "routes" / "_index.tsx").read_text()
-    assert "test-remix-app" in index_content
+    index_content = (output_dir / "app" / "routes" / "_index.tsx").read_bytes()
+    assert b"test-remix-app" in index_content
 
-    package_json = (output_dir / "package.json").read_text()
-    assert "test-remix-app" in package_json
+    package_json = (output_dir / "package.json").read_bytes()
+    assert b"test-remix-app" in package_json
 
 
-def test_post_processing_execution(template_dir, project_config, temp_dir):
+@pytest.mark.parametrize('template_dir', [{'post_script': MARKER_SCRIPT}], indirect=True)
+def test_post_processing_execution(template_dir, project_config, initializer_factory):
     """Test that post-processing script is executed."""
-    # Create a test post-processing script that creates a marker file
-    config_path = template_dir / "remix" / "config.yml"
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
-
-    marker_path = temp_dir / "post_processing_executed"
-    config['post_processing']['script'] = f"""#!/bin/bash
-    touch {marker_path}
-    """
-
-    with open(config_path, 'w') as f:
-        yaml.dump(config, f)
-
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.REMIX, RemixTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.REMIX, RemixTemplate)
 
     success = initializer.initialize_project(project_config)
     assert success
     assert initializer.wait_for_post_process_completed()
-    assert marker_path.exists()
-
-
-def test_config_file_loading(temp_dir):
-    """Test loading project configuration from JSON file."""
-    config_data = {
-        "name": "json-config-test",
-        "version": "1.0.0",
-        "description": "Test from JSON config",
-        "author": "Test Author",
-        "project_type": "remix",
-        "output_path": str(temp_dir / "output"),
-        "parameters": {
-            "typescript": True,
-            "styling_solution": "tailwind"
-        }
-    }
-
-    config_file = temp_dir / "config.json"
-    with open(config_file, 'w') as f:
-        json.dump(config_data, f)
-
-    config = ProjectInitializer.load_config(config_file)
-    assert config.name == "json-config-test"
-    assert config.project_type == ProjectType.REMIX
-    assert config.parameters["typescript"] is True
-    assert config.parameters["styling_solution"] == "tailwind"
-
-
-def test_template_variable_replacement(template_dir, project_config):
-    """Test template variable replacement in file contents."""
-    test_file = template_dir / "remix" / "test.txt"
-    test_content = """
-    Project: ${KAVIA_TEMPLATE_PROJECT_NAME}
-    Author: {KAVIA_PROJECT_AUTHOR}
-    Version: ${KAVIA_PROJECT_VERSION}
-    Description: {KAVIA_PROJECT_DESCRIPTION}
-    """
-    test_file.write_text(test_content)
-
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.REMIX, RemixTemplate)
-
-    success = initializer.initialize_project(project_config)
-    assert success
-
-    output_file = project_config.output_path / "test.txt"
-    assert output_file.exists()
-
-    content = output_file.read_text()
-    assert project_config.name in content
-    assert project_config.author in content
-    assert project_config.version in content
-    assert project_config.description in content
+    assert (project_config.output_path / "post_processing_executed").exists()
 
 
-def test_styling_solution_parameter(template_dir, temp_dir):
+def test_styling_solution_parameter(template_dir, tmp_path, initializer_factory):
     """Test that styling_solution parameter is properly validated."""
     # Test with missing styling_solution parameter
-    config = ProjectConfig(
-        name="test-remix-app",
-        version="1.0.0",
-        description="Test Remix Application",
-        author="Test Author",
-        project_type=ProjectType.REMIX,
-        output_path=temp_dir / "output",
+    config = replace(
+        BASE_PROJECT_CONFIG,
+        output_path=tmp_path / "output",
         parameters={
             "typescript": True
             # Missing styling_solution
         }
     )
 
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.REMIX, RemixTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.REMIX, RemixTemplate)
 
     success = initializer.initialize_project(config)
     assert not success
@@ -1,97 +1,106 @@
 import pytest
+from dataclasses import replace
 from pathlib import Path
-import shutil
-import tempfile
-import yaml
-import json
+from types import MappingProxyType
 
 from universalinit.templateconfig import ProjectConfig, ProjectType, TemplateInitInfo
-from universalinit.universalinit import ProjectInitializer, TemplateProvider, RemotionTemplate
-
-
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test outputs."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+from universalinit.universalinit import RemotionTemplate
+
+from _template_helpers import MARKER_SCRIPT, create_template_root, dump_config, requested_post_script
+
+
+BASE_PROJECT_CONFIG = ProjectConfig(
+    name="test-remotion-app",
+    version="1.0.0",
+    description="Test Remotion Application",
+    author="Test Author",
+    project_type=ProjectType.REMOTION,
+    output_path=Path("output"),
+    parameters=MappingProxyType({})
+)
+
+
+# Mock template tree matching Remotion's structure
+TEMPLATE_DIRS = ("src",)
+TEMPLATE_FILES = {
+    "src/index.ts": b"// ${KAVIA_TEMPLATE_PROJECT_NAME}",
+    "package.json": b'{"name": "${KAVIA_TEMPLATE_PROJECT_NAME}"}',
+}
+
+
+TEMPLATE_PATH = "__REMOTION_PATH__"
+CONFIG = {
+    'configure_environment': {
+        'command': 'npm install',
+        'working_directory': TEMPLATE_PATH
+    },
+    'build_cmd': {
+        'command': 'npm install && npm run build',
+        'working_directory': TEMPLATE_PATH
+    },
+    'install_dependencies': {
+        'command': 'npm install',
+        'working_directory': TEMPLATE_PATH
+    },
+    'env': {
+        'environment_initialized': True,
+        'node_version': '18.19.1',
+        'npm_version': '9.2.0'
+    },
+    'init_files': [],
+    'init_minimal': 'Minimal Remotion video project initialized',
+    'run_tool': {
+        'command': 'npm run start',
+        'working_directory': TEMPLATE_PATH
+    },
+    'test_tool': {
+        'command': 'npm run test',
+        'working_directory': TEMPLATE_PATH
+    },
+    'init_style': '',
+    'linter': {
+        'script_content': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\nnpx eslint "$@"\nESLINT_EXIT_CODE=$?\nnpm run build\nBUILD_EXIT_CODE=$?\nif [ $ESLINT_EXIT_CODE -ne 0 ] || [ $BUILD_EXIT_CODE -ne 0 ]; then\n\t   exit 1\nfi'
+    },
+    'post_processing': {
+        'script': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\nnpm install'
+    }
+}
 
 
-@pytest.fixture
-def template_dir(temp_dir):
-    """Create a mock template directory with necessary files."""
-    templates_path = temp_dir / "templates"
-    remotion_path = templates_path / "remotion"
-    remotion_path.mkdir(parents=True)
+@pytest.fixture(scope="session")
+def template_dir(request, tmp_path_factory):
+    """Create a mock template directory with necessary files.
 
+    The directory is shared by the whole session, so tests must not modify it.
+    Tests can pass `{'post_script': ...}` through indirect parametrization to
+    get a separate template with a different post-processing script.
+    """
     # Create mock config.yml
-    config = {
-        'configure_environment': {
-            'command': 'npm install',
-            'working_directory': str(remotion_path)
-        },
-        'build_cmd': {
-            'command': 'npm install && npm run build',
-            'working_directory': str(remotion_path)
-        },
-        'install_dependencies': {
-            'command': 'npm install',
-            'working_directory': str(remotion_path)
-        },
-        'env': {
-            'environment_initialized': True,
-            'node_version': '18.19.1',
-            'npm_version': '9.2.0'
-        },
-        'init_files': [],
-        'init_minimal': 'Minimal Remotion video project initialized',
-        'run_tool': {
-            'command': 'npm run start',
-            'working_directory': str(remotion_path)
-        },
-        'test_tool': {
-            'command': 'npm run test',
-            'working_directory': str(remotion_path)
-        },
-        'init_style': '',
-        'linter': {
-            'script_content': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\nnpx eslint "$@"\nESLINT_EXIT_CODE=$?\nnpm run build\nBUILD_EXIT_CODE=$?\nif [ $ESLINT_EXIT_CODE -ne 0 ] || [ $BUILD_EXIT_CODE -ne 0 ]; then\n\t   exit 1\nfi'
-        },
-        'post_processing': {
-            'script': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\nnpm install'
-        }
-    }
-
-    with open(remotion_path / "config.yml", 'w') as f:
-        yaml.dump(config, f)
+    config_yml = dump_config(CONFIG, requested_post_script(request))
+    remotion_path = create_template_root(tmp_path_factory, "remotion", config_yml, TEMPLATE_PATH)
 
-    # Create some mock template files
-    (remotion_path / "src").mkdir()
-    (remotion_path / "src" / "index.ts").write_text("// ${KAVIA_TEMPLATE_PROJECT_NAME}")
-    (remotion_path / "package.json").write_text('{"name": "${KAVIA_TEMPLATE_PROJECT_NAME}"}')
+    # Create some mock template files that match Remotion's structure
+    for directory in TEMPLATE_DIRS:
+        (remotion_path / directory).mkdir(parents=True, exist_ok=True)
+    for relative_path, content in TEMPLATE_FILES.items():
+        (remotion_path / relative_path).write_bytes(content)
 
-    return templates_path
+    return remotion_path.parent
 
 
 @pytest.fixture
-def project_config(temp_dir):
+def project_config(tmp_path):
     """Create a test project configuration."""
-    return ProjectConfig(
-        name="test-remotion-app",
-        version="1.0.0",
-        description="Test Remotion Application",
-        author="Test Author",
-        project_type=ProjectType.REMOTION,
-        output_path=temp_dir / "output",
-        parameters={}
+    return replace(
+        BASE_PROJECT_CONFIG,
+        output_path=tmp_path / "output",
+        parameters=dict(BASE_PROJECT_CONFIG.parameters),
     )
 
 
-def test_remotion_init_info(template_dir, project_config):
+def test_remotion_init_info(template_dir, project_config, initializer_factory):
     """Test that getting template init info works correctly."""
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.REMOTION, RemotionTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.REMOTION, RemotionTemplate)
     template = initializer.template_factory.create_template(project_config)
     
     init_info = template.get_init_info()
@@ -101,11 +110,10 @@ def test_remotion_init_info(template_dir, project_config):
     assert init_info.configure_environment.command == 'npm install'
 
 
-def test_project_initialization(template_dir, project_config):
+@pytest.mark.usefixtures("no_post_processing")
+def test_project_initialization(template_dir, project_config, initializer_factory):
     """Test basic project initialization."""
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.REMOTION, RemotionTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.REMOTION, RemotionTemplate)
 
     success = initializer.initialize_project(project_config)
     assert success
@@ -117,82 +125,19 @@ def test_project_initialization(template_dir, project_config):
     assert (output_dir / "package.json").exists()
 
     # Verify content replacement
-    index_content = (output_dir / "src" / "index.ts").read_text()
-    assert "test-remotion-app" in index_content
+    index_content = (output_dir / "src" / "index.ts").read_bytes()
+    assert b"test-remotion-app" in index_content
 
-    package_json = (output_dir / "package.json").read_text()
-    assert "test-remotion-app" in package_json
+    package_json = (output_dir / "package.json").read_bytes()
+    assert b"test-remotion-app" in package_json
 
 
-def test_post_processing_execution(template_dir, project_config, temp_dir):
+@pytest.mark.parametrize('template_dir', [{'post_script': MARKER_SCRIPT}], indirect=True)
+def test_post_processing_execution(template_dir, project_config, initializer_factory):
     """Test that post-processing script is executed."""
-    # Create a test post-processing script that creates a marker file
-    config_path = template_dir / "remotion" / "config.yml"
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
-
-    marker_path = temp_dir / "post_processing_executed"
-    config['post_processing']['script'] = f"""#!/bin/bash
-    touch {marker_path}
-    """
-
-    with open(config_path, 'w') as f:
-        yaml.dump(config, f)
-
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.REMOTION, RemotionTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.REMOTION, RemotionTemplate)
 
     success = initializer.initialize_project(project_config)
     assert success
     assert initializer.wait_for_post_process_completed()
-    assert marker_path.exists()
-
-
-def test_config_file_loading(temp_dir):
-    """Test loading project configuration from JSON file."""
-    config_data = {
-        "name": "json-config-test",
-        "version": "1.0.0",
-        "description": "Test from JSON config",
-        "author": "Test Author",
-        "project_type": "remotion",
-        "output_path": str(temp_dir / "output"),
-        "parameters": {}
-    }
-
-    config_file = temp_dir / "config.json"
-    with open(config_file, 'w') as f:
-        json.dump(config_data, f)
-
-    config = ProjectInitializer.load_config(config_file)
-    assert config.name == "json-config-test"
-    assert config.project_type == ProjectType.REMOTION
-
-
-def test_template_variable_replacement(template_dir, project_config):
-    """Test template variable replacement in file contents."""
-    test_file = template_dir / "remotion" / "test.txt"
-    test_content = """
-    Project: ${KAVIA_TEMPLATE_PROJECT_NAME}
-    Author: {KAVIA_PROJECT_AUTHOR}
-    Version: ${KAVIA_PROJECT_VERSION}
-    Description: {KAVIA_PROJECT_DESCRIPTION}
-    """
-    test_file.write_text(test_content)
-
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.REMOTION, RemotionTemplate)
-
-    success = initializer.initialize_project(project_config)
-    assert success
-
-    output_file = project_config.output_path / "test.txt"
-    assert output_file.exists()
-
-    content = output_file.read_text()
-    assert project_config.name in content
-    assert project_config.author in content
-    assert project_config.version in content
-    assert project_config.description in content
+    assert (project_config.output_path / "post_processing_executed").exists()
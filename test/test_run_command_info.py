@@ -1,10 +1,36 @@
 import pytest
 import json
+from argparse import Namespace
+from collections import namedtuple
 from unittest.mock import MagicMock, patch
 
-from universalinit.templateconfig import TemplateInitInfo, RunTool
+from universalinit.templateconfig import ProjectType, TemplateInitInfo, RunTool
 from universalinit.universalinit import ProjectInitializer
-from universalinit.cli import handle_get_run_command, create_minimal_project_config
+from universalinit.cli import handle_get_run_command
+
+
+MockStack = namedtuple('MockStack', 'init_info template factory initializer')
+
+
+@pytest.fixture(scope="module")
+def mock_stack():
+    """Patch the CLI's ProjectInitializer with mocks shared by every case in the module.
+
+    Tests set init_info.run_tool for their case and clear the call records they assert on.
+    """
+    init_info = MagicMock(spec=TemplateInitInfo)
+
+    template = MagicMock()
+    template.get_init_info.return_value = init_info
+
+    factory = MagicMock()
+    factory.create_template.return_value = template
+
+    initializer = MagicMock(spec=ProjectInitializer)
+    initializer.template_factory = factory
+
+    with patch('universalinit.cli.ProjectInitializer', return_value=initializer):
+        yield MockStack(init_info, template, factory, initializer)
 
 
 @pytest.mark.parametrize("project_type,expected_run_command", [
@@ -37,49 +63,30 @@ from universalinit.cli import handle_get_run_command, create_minimal_project_con
     ("mysql", "sudo ./startup.sh && cd db_visualizer && PORT=<port> HOST=<host> BROWSER=none npm start"),
     ("sqlite", "python init_db.py && cd db_visualizer && PORT=<port> HOST=<host> BROWSER=none npm start")
 ])
-def test_get_run_command(project_type, expected_run_command):
+def test_get_run_command(mock_stack, capsys, project_type, expected_run_command):
     """Test retrieving run commands for different project types."""
 
     # Test setup
-    mock_init_info = MagicMock(spec=TemplateInitInfo)
-    mock_init_info.run_tool = RunTool(
+    mock_stack.init_info.run_tool = RunTool(
         command=expected_run_command,
         working_directory="."
     )
-    
-    mock_template = MagicMock()
-    mock_template.get_init_info.return_value = mock_init_info
-    
-    mock_factory = MagicMock()
-    mock_factory.create_template.return_value = mock_template
-
-    mock_initializer = MagicMock(spec=ProjectInitializer)
-    mock_initializer.template_factory = mock_factory
-    
-    mock_args = MagicMock()
-    mock_args.type = project_type
-    mock_args.parameters = None
+    mock_stack.factory.create_template.reset_mock()
+    mock_stack.template.get_init_info.reset_mock()
+
+    mock_args = Namespace(type=project_type, parameters=None)
 
     # Test execution
-    with patch('universalinit.cli.ProjectInitializer', return_value=mock_initializer):
-        with patch('builtins.print') as mock_print:
-            result = handle_get_run_command(mock_args)
-            
-            # Asserts
-            assert result == 0
-            
-            config = create_minimal_project_config(project_type)
-            mock_initializer.template_factory.create_template.assert_called_once()
-            mock_template.get_init_info.assert_called_once()
-            mock_print.assert_called()
-            
-            json_output = mock_print.call_args_list[0][0][0]
-            try:
-                parsed_output = json.loads(json_output)
-                assert parsed_output["project_type"] == project_type
-                assert parsed_output["run_command"] == expected_run_command
-            except json.JSONDecodeError:
-                calls = [str(call) for call in mock_print.call_args_list]
-                output = ' '.join(calls)
-                assert project_type in output
-                assert expected_run_command.replace('"', '\\"').replace("'", "\\'") in output
+    result = handle_get_run_command(mock_args)
+
+    # Asserts
+    assert result == 0
+
+    mock_stack.factory.create_template.assert_called_once()
+    config = mock_stack.factory.create_template.call_args.args[0]
+    assert config.project_type == ProjectType.from_string(project_type)
+    mock_stack.template.get_init_info.assert_called_once()
+
+    parsed_output = json.loads(capsys.readouterr().out)
+    assert parsed_output["project_type"] == project_type
+    assert parsed_output["run_command"] == expected_run_command
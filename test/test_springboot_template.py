@@ -1,274 +1,230 @@
 import pytest
+from dataclasses import replace
+from operator import attrgetter
 from pathlib import Path
-import shutil
-import tempfile
-import yaml
-import json
+from types import MappingProxyType
 
-from universalinit.templateconfig import ProjectConfig, ProjectType, TemplateInitInfo
-from universalinit.universalinit import ProjectInitializer, TemplateProvider, SpringBootTemplate
+from universalinit.templateconfig import ProjectConfig, ProjectType, TemplateConfigProvider, TemplateInitInfo
+from universalinit.universalinit import SpringBootTemplate
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test outputs."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+BASE_PROJECT_CONFIG = ProjectConfig(
+    name="test-springboot-app",
+    version="1.0.0",
+    description="Test Spring Boot Application",
+    author="Test Author",
+    project_type=ProjectType.SPRINGBOOT,
+    output_path=Path("output"),
+    parameters=MappingProxyType({})
+)
 
+# Mock config.yml, authored as YAML text so the fixture writes it without serializing
+CONFIG_YML = """\
+configure_environment:
+  command: ./gradlew build
+  working_directory: '{KAVIA_PROJECT_DIRECTORY}'
+build_cmd:
+  command: ./gradlew build
+  working_directory: '{KAVIA_PROJECT_DIRECTORY}'
+install_dependencies:
+  command: ./gradlew dependencies
+  working_directory: '{KAVIA_PROJECT_DIRECTORY}'
+env:
+  environment_initialized: true
+  java_version: '17'
+  gradle_version: '8.14.3'
+init_files: []
+init_minimal: Minimal Spring Boot application initialized
+openapi_generation:
+  command: ./gradlew bootRun
+  working_directory: '{KAVIA_PROJECT_DIRECTORY}'
+run_tool:
+  command: ./gradlew bootRun
+  working_directory: '{KAVIA_PROJECT_DIRECTORY}'
+test_tool:
+  command: ./gradlew test
+  working_directory: '{KAVIA_PROJECT_DIRECTORY}'
+init_style: springboot
+entry_point_url: http://localhost:3000/docs
+linter:
+  script_content: |-
+    #!/bin/bash
+    cd {KAVIA_PROJECT_DIRECTORY}
+    ./gradlew checkstyleMain
+post_processing:
+  script: |-
+    #!/bin/bash
+    cd {KAVIA_PROJECT_DIRECTORY}
+    chmod +x ./gradlew
+    ./gradlew build
+"""
 
-@pytest.fixture
-def template_dir(temp_dir):
-    """Create a mock template directory with necessary files."""
-    templates_path = temp_dir / "templates"
+
+# Mock Spring Boot project tree
+TEMPLATE_DIRS = ("src/main/java/com/example/demo", "src/main/resources")
+TEMPLATE_FILES = {
+    "src/main/java/com/example/demo/DemoApplication.java": (
+        b"package com.example.{KAVIA_TEMPLATE_PROJECT_NAME};\n\n"
+        b"import org.springframework.boot.SpringApplication;\n"
+        b"import org.springframework.boot.autoconfigure.SpringBootApplication;\n\n"
+        b"@SpringBootApplication\n"
+        b"public class {KAVIA_TEMPLATE_PROJECT_NAME}Application {\n\n"
+        b"    public static void main(String[] args) {\n"
+        b"        SpringApplication.run({KAVIA_TEMPLATE_PROJECT_NAME}Application.class, args);\n"
+        b"    }\n\n"
+        b"}"
+    ),
+    "build.gradle": (
+        b"plugins {\n"
+        b"    id 'java'\n"
+        b"    id 'org.springframework.boot' version '3.4.8'\n"
+        b"    id 'io.spring.dependency-management' version '1.1.7'\n"
+        b"}\n\n"
+        b"group = 'com.example'\n"
+        b"version = '{KAVIA_PROJECT_VERSION}'\n\n"
+        b"java {\n"
+        b"    toolchain {\n"
+        b"        languageVersion = JavaLanguageVersion.of(17)\n"
+        b"    }\n"
+        b"}\n\n"
+        b"repositories {\n"
+        b"    mavenCentral()\n"
+        b"}\n\n"
+        b"dependencies {\n"
+        b"    implementation 'org.springframework.boot:spring-boot-starter-actuator'\n"
+        b"    implementation 'org.springframework.boot:spring-boot-starter-data-jpa'\n"
+        b"    implementation 'org.springframework.boot:spring-boot-starter-web'\n"
+        b"    implementation 'org.springdoc:springdoc-openapi-starter-webmvc-ui:2.3.0'\n"
+        b"    developmentOnly 'org.springframework.boot:spring-boot-devtools'\n"
+        b"    runtimeOnly 'com.h2database:h2'\n"
+        b"    testImplementation 'org.springframework.boot:spring-boot-starter-test'\n"
+        b"    testRuntimeOnly 'org.junit.platform:junit-platform-launcher'\n"
+        b"}\n\n"
+        b"tasks.named('test') {\n"
+        b"    useJUnitPlatform()\n"
+        b"}"
+    ),
+    "settings.gradle": b"rootProject.name = '{KAVIA_TEMPLATE_PROJECT_NAME}'",
+    "src/main/resources/application.properties": (
+        b"spring.application.name={KAVIA_TEMPLATE_PROJECT_NAME}\n"
+        b"server.port=3000\n\n"
+        b"# H2 Database Configuration\n"
+        b"spring.datasource.url=jdbc:h2:mem:testdb\n"
+        b"spring.datasource.driverClassName=org.h2.Driver\n"
+        b"spring.datasource.username=sa\n"
+        b"spring.datasource.password=\n"
+        b"spring.h2.console.enabled=true\n\n"
+        b"# JPA Configuration\n"
+        b"spring.jpa.database-platform=org.hibernate.dialect.H2Dialect\n"
+        b"spring.jpa.hibernate.ddl-auto=create-drop\n"
+        b"spring.jpa.show-sql=true\n\n"
+        b"# Actuator Configuration\n"
+        b"management.endpoints.web.exposure.include=health,info,metrics\n\n"
+        b"# Swagger/OpenAPI Configuration\n"
+        b"springdoc.api-docs.path=/api-docs\n"
+        b"springdoc.swagger-ui.path=/swagger-ui.html\n"
+        b"springdoc.swagger-ui.operationsSorter=method\n"
+        b"springdoc.swagger-ui.tagsSorter=alpha"
+    ),
+}
+
+
+@pytest.fixture(scope="session")
+def template_dir(tmp_path_factory):
+    """Create a mock template directory with necessary files.
+
+    The directory is shared by the whole session, so tests must not modify it.
+    """
+    templates_path = tmp_path_factory.mktemp("springboot") / "templates"
     springboot_path = templates_path / "springboot"
     springboot_path.mkdir(parents=True)
 
     # Create mock config.yml
-    config = {
-        'configure_environment': {
-            'command': './gradlew build',
-            'working_directory': '{KAVIA_PROJECT_DIRECTORY}'
-        },
-        'build_cmd': {
-            'command': './gradlew build',
-            'working_directory': '{KAVIA_PROJECT_DIRECTORY}'
-        },
-        'install_dependencies': {
-            'command': './gradlew dependencies',
-            'working_directory': '{KAVIA_PROJECT_DIRECTORY}'
-        },
-        'env': {
-            'environment_initialized': True,
-            'java_version': '17',
-            'gradle_version': '8.14.3'
-        },
-        'init_files': [],
-        'init_minimal': 'Minimal Spring Boot application initialized',
-        'openapi_generation': {
-            'command': './gradlew bootRun',
-            'working_directory': '{KAVIA_PROJECT_DIRECTORY}'
-        },
-        'run_tool': {
-            'command': './gradlew bootRun',
-            'working_directory': '{KAVIA_PROJECT_DIRECTORY}'
-        },
-        'test_tool': {
-            'command': './gradlew test',
-            'working_directory': '{KAVIA_PROJECT_DIRECTORY}'
-        },
-        'init_style': 'springboot',
-        'entry_point_url': 'http://localhost:3000/docs',
-        'linter': {
-            'script_content': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\n./gradlew checkstyleMain'
-        },
-        'post_processing': {
-            'script': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\nchmod +x ./gradlew\n./gradlew build'
-        }
-    }
-
-    with open(springboot_path / "config.yml", 'w') as f:
-        yaml.dump(config, f)
-
-    # Create mock template files
-    (springboot_path / "src").mkdir()
-    (springboot_path / "src" / "main").mkdir()
-    (springboot_path / "src" / "main" / "java").mkdir()
-    (springboot_path / "src" / "main" / "java" / "com").mkdir()
-    (springboot_path / "src" / "main" / "java" / "com" / "example").mkdir()
-    (springboot_path / "src" / "main" / "java" / "com" / "example" / "demo").mkdir()
-    
-    # Create main application file
-    (springboot_path / "src" / "main" / "java" / "com" / "example" / "demo" / "DemoApplication.java").write_text(
-        "package com.example.{KAVIA_TEMPLATE_PROJECT_NAME};\n\n"
-        "import org.springframework.boot.SpringApplication;\n"
-        "import org.springframework.boot.autoconfigure.SpringBootApplication;\n\n"
-        "@SpringBootApplication\n"
-        "public class {KAVIA_TEMPLATE_PROJECT_NAME}Application {\n\n"
-        "    public static void main(String[] args) {\n"
-        "        SpringApplication.run({KAVIA_TEMPLATE_PROJECT_NAME}Application.class, args);\n"
-        "    }\n\n"
-        "}"
-    )
-    
-    # Create build.gradle
-    (springboot_path / "build.gradle").write_text(
-        "plugins {\n"
-        "    id 'java'\n"
-        "    id 'org.springframework.boot' version '3.4.8'\n"
-        "    id 'io.spring.dependency-management' version '1.1.7'\n"
-        "}\n\n"
-        "group = 'com.example'\n"
-        "version = '{KAVIA_PROJECT_VERSION}'\n\n"
-        "java {\n"
-        "    toolchain {\n"
-        "        languageVersion = JavaLanguageVersion.of(17)\n"
-        "    }\n"
-        "}\n\n"
-        "repositories {\n"
-        "    mavenCentral()\n"
-        "}\n\n"
-        "dependencies {\n"
-        "    implementation 'org.springframework.boot:spring-boot-starter-actuator'\n"
-        "    implementation 'org.springframework.boot:spring-boot-starter-data-jpa'\n"
-        "    implementation 'org.springframework.boot:spring-boot-starter-web'\n"
-        "    implementation 'org.springdoc:springdoc-openapi-starter-webmvc-ui:2.3.0'\n"
-        "    developmentOnly 'org.springframework.boot:spring-boot-devtools'\n"
-        "    runtimeOnly 'com.h2database:h2'\n"
-        "    testImplementation 'org.springframework.boot:spring-boot-starter-test'\n"
-        "    testRuntimeOnly 'org.junit.platform:junit-platform-launcher'\n"
-        "}\n\n"
-        "tasks.named('test') {\n"
-        "    useJUnitPlatform()\n"
-        "}"
-    )
-    
-    # Create settings.gradle
-    (springboot_path / "settings.gradle").write_text("rootProject.name = '{KAVIA_TEMPLATE_PROJECT_NAME}'")
-    
-    # Create application.properties
-    (springboot_path / "src" / "main" / "resources").mkdir(parents=True)
-    (springboot_path / "src" / "main" / "resources" / "application.properties").write_text(
-        "spring.application.name={KAVIA_TEMPLATE_PROJECT_NAME}\n"
-        "server.port=3000\n\n"
-        "# H2 Database Configuration\n"
-        "spring.datasource.url=jdbc:h2:mem:testdb\n"
-        "spring.datasource.driverClassName=org.h2.Driver\n"
-        "spring.datasource.username=sa\n"
-        "spring.datasource.password=\n"
-        "spring.h2.console.enabled=true\n\n"
-        "# JPA Configuration\n"
-        "spring.jpa.database-platform=org.hibernate.dialect.H2Dialect\n"
-        "spring.jpa.hibernate.ddl-auto=create-drop\n"
-        "spring.jpa.show-sql=true\n\n"
-        "# Actuator Configuration\n"
-        "management.endpoints.web.exposure.include=health,info,metrics\n\n"
-        "# Swagger/OpenAPI Configuration\n"
-        "springdoc.api-docs.path=/api-docs\n"
-        "springdoc.swagger-ui.path=/swagger-ui.html\n"
-        "springdoc.swagger-ui.operationsSorter=method\n"
-        "springdoc.swagger-ui.tagsSorter=alpha"
-    )
+    (springboot_path / "config.yml").write_text(CONFIG_YML)
+
+    for directory in TEMPLATE_DIRS:
+        (springboot_path / directory).mkdir(parents=True, exist_ok=True)
+    for relative_path, content in TEMPLATE_FILES.items():
+        (springboot_path / relative_path).write_bytes(content)
 
     return templates_path
 
 
-@pytest.fixture
-def project_config(temp_dir):
-    """Create a test project configuration."""
-    return ProjectConfig(
-        name="test-springboot-app",
-        version="1.0.0",
-        description="Test Spring Boot Application",
-        author="Test Author",
-        project_type=ProjectType.SPRINGBOOT,
-        output_path=temp_dir / "output",
-        parameters={}
+@pytest.fixture(scope="module")
+def base_project_config(tmp_path_factory):
+    """Create the project configuration shared by the module's tests.
+
+    Tests must not modify it; take a copy with dataclasses.replace instead.
+    """
+    return replace(
+        BASE_PROJECT_CONFIG,
+        output_path=tmp_path_factory.mktemp("springboot-output") / "output",
+        parameters=dict(BASE_PROJECT_CONFIG.parameters),
     )
 
 
-def test_springboot_init_info(template_dir, project_config):
-    """Test that getting template init info works correctly."""
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.SPRINGBOOT, SpringBootTemplate)
-    template = initializer.template_factory.create_template(project_config)
-    
-    init_info = template.get_init_info()
+@pytest.fixture(scope="module")
+def initializer(template_dir, initializer_factory):
+    """Return the Spring Boot initializer shared by the module's tests."""
+    return initializer_factory(template_dir, ProjectType.SPRINGBOOT, SpringBootTemplate)
+
+
+@pytest.fixture(scope="module")
+def template(initializer, base_project_config):
+    """Create the Spring Boot template once for the module.
+
+    Tests only read from the template, so they can share one instance.
+    """
+    return initializer.template_factory.create_template(base_project_config)
 
+
+@pytest.fixture(scope="module")
+def init_info(template):
+    """Load the Spring Boot template init info once for the module."""
+    return template.get_init_info()
+
+
+@pytest.mark.parametrize("attribute,expected", [
+    ("build_cmd.command", './gradlew build'),
+    ("run_tool.command", './gradlew bootRun'),
+    ("test_tool.command", './gradlew test'),
+    ("entry_point_url", 'http://localhost:3000/docs'),
+    ("env_config.java_version", '17'),
+    ("env_config.gradle_version", '8.14.3'),
+])
+def test_springboot_init_info(init_info, attribute, expected):
+    """Test that getting template init info works correctly."""
     # Check that init_info has all required components
     assert isinstance(init_info, TemplateInitInfo)
-    assert init_info.build_cmd.command == './gradlew build'
-    assert init_info.run_tool.command == './gradlew bootRun'
-    assert init_info.test_tool.command == './gradlew test'
-    assert init_info.entry_point_url == 'http://localhost:3000/docs'
-    assert init_info.env_config.java_version == '17'
-    assert init_info.env_config.gradle_version == '8.14.3'
-
-
-def test_project_initialization(template_dir, project_config):
-    """Test basic project initialization."""
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.SPRINGBOOT, SpringBootTemplate)
-    
-    # Mock the template to avoid actual file operations
-    template = initializer.template_factory.create_template(project_config)
-    
-    # Test validation
-    assert template.validate_parameters() is True
+    assert attrgetter(attribute)(init_info) == expected
 
 
-def test_post_processing_execution(template_dir, project_config, temp_dir):
+def test_post_processing_execution(init_info):
     """Test that post-processing script is executed correctly."""
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.SPRINGBOOT, SpringBootTemplate)
-    
-    # Create output directory
-    output_dir = temp_dir / "output"
-    output_dir.mkdir()
-    
-    # Mock the template
-    template = initializer.template_factory.create_template(project_config)
-    
     # Test that post-processing script exists in config
-    init_info = template.get_init_info()
     assert init_info.post_processing.script is not None
     assert 'chmod +x ./gradlew' in init_info.post_processing.script
     assert './gradlew build' in init_info.post_processing.script
 
 
-def test_config_file_loading(temp_dir):
-    """Test that config.yml can be loaded correctly."""
-    templates_path = temp_dir / "templates"
-    springboot_path = templates_path / "springboot"
-    springboot_path.mkdir(parents=True)
-    
-    config = {
-        'build_cmd': {
-            'command': './gradlew build',
-            'working_directory': '{KAVIA_PROJECT_DIRECTORY}'
-        },
-        'run_tool': {
-            'command': './gradlew bootRun',
-            'working_directory': '{KAVIA_PROJECT_DIRECTORY}'
-        },
-        'test_tool': {
-            'command': './gradlew test',
-            'working_directory': '{KAVIA_PROJECT_DIRECTORY}'
-        },
-        'env': {
-            'environment_initialized': True,
-            'java_version': '17',
-            'gradle_version': '8.14.3'
-        },
-        'entry_point_url': 'http://localhost:3000/docs'
-    }
-    
-    with open(springboot_path / "config.yml", 'w') as f:
-        yaml.dump(config, f)
-    
-    # Test that config can be loaded
-    with open(springboot_path / "config.yml", 'r') as f:
-        loaded_config = yaml.safe_load(f)
-    
-    assert loaded_config['build_cmd']['command'] == './gradlew build'
-    assert loaded_config['run_tool']['command'] == './gradlew bootRun'
-    assert loaded_config['test_tool']['command'] == './gradlew test'
-    assert loaded_config['env']['java_version'] == '17'
-    assert loaded_config['entry_point_url'] == 'http://localhost:3000/docs'
+def test_config_file_loading(template_dir, base_project_config):
+    """Test that the template's config.yml is loaded correctly."""
+    config_provider = TemplateConfigProvider(template_dir / "springboot", base_project_config)
+    loaded_config = config_provider.get_init_info()
+
+    assert loaded_config.build_cmd.command == './gradlew build'
+    assert loaded_config.run_tool.command == './gradlew bootRun'
+    assert loaded_config.test_tool.command == './gradlew test'
+    assert loaded_config.env_config.java_version == '17'
+    assert loaded_config.entry_point_url == 'http://localhost:3000/docs'
+    # {KAVIA_PROJECT_DIRECTORY} is replaced while the config is loaded
+    assert loaded_config.build_cmd.working_directory == str(base_project_config.output_path)
 
 
-def test_template_variable_replacement(template_dir, project_config):
+def test_template_variable_replacement(base_project_config):
     """Test that template variables are replaced correctly."""
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.SPRINGBOOT, SpringBootTemplate)
-    template = initializer.template_factory.create_template(project_config)
-    
     # Test variable replacement
-    replacements = project_config.get_replaceable_parameters()
+    replacements = base_project_config.get_replaceable_parameters()
     
     assert replacements['KAVIA_TEMPLATE_PROJECT_NAME'] == 'testspringbootapp'
     assert replacements['KAVIA_PROJECT_VERSION'] == '1.0.0'
@@ -276,52 +232,43 @@ def test_template_variable_replacement(template_dir, project_config):
     assert replacements['KAVIA_PROJECT_DESCRIPTION'] == 'Test Spring Boot Application'
 
 
-def test_springboot_template_structure(template_dir, project_config):
-    """Test that Spring Boot template has correct structure."""
-    springboot_path = template_dir / "springboot"
-    
-    # Check essential files exist
-    assert (springboot_path / "config.yml").exists()
-    assert (springboot_path / "build.gradle").exists()
-    assert (springboot_path / "settings.gradle").exists()
-    assert (springboot_path / "src" / "main" / "resources" / "application.properties").exists()
-    assert (springboot_path / "src" / "main" / "java" / "com" / "example" / "demo" / "DemoApplication.java").exists()
+# Substrings each template file must contain; a missing file fails its checks when it is read
+TEMPLATE_CONTENT_CHECKS = [
+    ("config.yml", "./gradlew bootRun"),
+    ("settings.gradle", "rootProject.name = '{KAVIA_TEMPLATE_PROJECT_NAME}'"),
+    ("build.gradle", "org.springframework.boot"),
+    ("build.gradle", "spring-boot-starter-web"),
+    ("build.gradle", "spring-boot-starter-data-jpa"),
+    ("build.gradle", "springdoc-openapi-starter-webmvc-ui"),
+    ("src/main/resources/application.properties", "spring.application.name={KAVIA_TEMPLATE_PROJECT_NAME}"),
+    ("src/main/resources/application.properties", "server.port=3000"),
+    ("src/main/resources/application.properties", "spring.h2.console.enabled=true"),
+    ("src/main/java/com/example/demo/DemoApplication.java", "@SpringBootApplication"),
+    ("src/main/java/com/example/demo/DemoApplication.java", "{KAVIA_TEMPLATE_PROJECT_NAME}Application"),
+]
 
 
-def test_springboot_template_content(template_dir, project_config):
-    """Test that template files contain expected content."""
+@pytest.fixture(scope="module")
+def file_contents(template_dir):
+    """Read each checked template file once for the module."""
     springboot_path = template_dir / "springboot"
-    
-    # Check build.gradle content
-    build_gradle_content = (springboot_path / "build.gradle").read_text()
-    assert 'org.springframework.boot' in build_gradle_content
-    assert 'spring-boot-starter-web' in build_gradle_content
-    assert 'spring-boot-starter-data-jpa' in build_gradle_content
-    assert 'springdoc-openapi-starter-webmvc-ui' in build_gradle_content
-    
-    # Check application.properties content
-    app_props_content = (springboot_path / "src" / "main" / "resources" / "application.properties").read_text()
-    assert 'spring.application.name={KAVIA_TEMPLATE_PROJECT_NAME}' in app_props_content
-    assert 'server.port=3000' in app_props_content
-    assert 'spring.h2.console.enabled=true' in app_props_content
-    
-    # Check main application class
-    app_class_content = (springboot_path / "src" / "main" / "java" / "com" / "example" / "demo" / "DemoApplication.java").read_text()
-    assert '@SpringBootApplication' in app_class_content
-    assert '{KAVIA_TEMPLATE_PROJECT_NAME}Application' in app_class_content
+    return {rel: (springboot_path / rel).read_text() for rel in dict.fromkeys(rel for rel, _ in TEMPLATE_CONTENT_CHECKS)}
+
+
+@pytest.mark.parametrize("rel,needle", TEMPLATE_CONTENT_CHECKS)
+def test_springboot_template_content(file_contents, rel, needle):
+    """Test that Spring Boot template files exist and contain expected content."""
+    assert needle in file_contents[rel]
 
 
-def test_springboot_template_validation(template_dir, project_config):
+@pytest.mark.parametrize("parameters", [
+    {},
+    {'java_version': '21', 'gradle_version': '8.5'},
+    {'java_version': '17'},
+])
+def test_springboot_template_validation(initializer, base_project_config, parameters):
     """Test that Spring Boot template validation works correctly."""
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.SPRINGBOOT, SpringBootTemplate)
+    # Spring Boot doesn't require specific parameters
+    project_config = replace(base_project_config, parameters=dict(parameters))
     template = initializer.template_factory.create_template(project_config)
-    
-    # Test validation - Spring Boot doesn't require specific parameters
     assert template.validate_parameters() is True
-    
-    # Test with different parameters
-    project_config.parameters = {'java_version': '21', 'gradle_version': '8.5'}
-    template = initializer.template_factory.create_template(project_config)
-    assert template.validate_parameters() is True 
\ No newline at end of file
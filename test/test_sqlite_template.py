@@ -1,76 +1,17 @@
+import contextlib
 import pytest
-from pathlib import Path
-import shutil
-import tempfile
-import yaml
-import json
+import re
+import runpy
 import sqlite3
+import threading
 
 from universalinit.templateconfig import ProjectConfig, ProjectType, TemplateInitInfo
-from universalinit.universalinit import ProjectInitializer, TemplateProvider, SQLiteTemplate
+from universalinit.universalinit import SQLiteTemplate
 
+from _template_helpers import create_template_root, dump_config, requested_post_script
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test outputs."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
-
-
-@pytest.fixture
-def template_dir(temp_dir):
-    """Create a mock template directory with necessary files."""
-    templates_path = temp_dir / "templates"
-    sqlite_path = templates_path / "sqlite"
-    sqlite_path.mkdir(parents=True)
-
-    # Create mock config.yml
-    config = {
-        'configure_environment': {
-            'command': 'python init_db.py',
-            'working_directory': str(sqlite_path)
-        },
-        'build_cmd': {
-            'command': 'python init_db.py',
-            'working_directory': '{KAVIA_PROJECT_DIRECTORY}'
-        },
-        'install_dependencies': {
-            'command': 'ls',
-            'working_directory': str(sqlite_path)
-        },
-        'env': {
-            'environment_initialized': True,
-            'python_version': '3.8+'
-        },
-        'init_files': [],
-        'init_minimal': 'SQLite database initialized',
-        'run_tool': {
-            'command': 'python db_shell.py',
-            'working_directory': '{KAVIA_PROJECT_DIRECTORY}'
-        },
-        'test_tool': {
-            'command': 'python test_db.py',
-            'working_directory': '{KAVIA_PROJECT_DIRECTORY}'
-        },
-        'init_style': 'database',
-        'entry_point_url': 'sqlite:///{KAVIA_PROJECT_DIRECTORY}/{KAVIA_DB_NAME}',
-        'linter': {
-            'script_content': '#!/bin/bash\necho "No linting required for database configuration"'
-        },
-        'pre_processing': {
-            'script': ''
-        },
-        'post_processing': {
-            'script': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\npython init_db.py\necho "SQLite database is ready at {KAVIA_DB_NAME}"'
-        }
-    }
 
-    with open(sqlite_path / "config.yml", 'w') as f:
-        yaml.dump(config, f)
-
-    # Create init_db.py template
-    init_db_content = '''#!/usr/bin/env python3
+INIT_DB_CONTENT = b'''#!/usr/bin/env python3
 """Initialize SQLite database for {KAVIA_TEMPLATE_PROJECT_NAME}"""
 
 import sqlite3
@@ -129,10 +70,8 @@ conn.close()
 
 print(f"SQLite database created: {DB_NAME}")
 '''
-    (sqlite_path / "init_db.py").write_text(init_db_content)
 
-    # Create db_shell.py template
-    db_shell_content = '''#!/usr/bin/env python3
+DB_SHELL_CONTENT = b'''#!/usr/bin/env python3
 """Interactive SQLite database shell for {KAVIA_TEMPLATE_PROJECT_NAME}"""
 
 import sqlite3
@@ -163,10 +102,8 @@ def main():
 if __name__ == "__main__":
     main()
 '''
-    (sqlite_path / "db_shell.py").write_text(db_shell_content)
 
-    # Create test_db.py template
-    test_db_content = '''#!/usr/bin/env python3
+TEST_DB_CONTENT = b'''#!/usr/bin/env python3
 """Test SQLite database connection"""
 
 import sqlite3
@@ -195,10 +132,8 @@ except sqlite3.Error as e:
     print(f"Connection failed: {e}")
     sys.exit(1)
 '''
-    (sqlite_path / "test_db.py").write_text(test_db_content)
 
-    # Create README.md template
-    readme_content = '''# {KAVIA_TEMPLATE_PROJECT_NAME} SQLite Database
+README_CONTENT = b'''# {KAVIA_TEMPLATE_PROJECT_NAME} SQLite Database
 
 ## Overview
 This is a SQLite database project created by {KAVIA_PROJECT_AUTHOR}.
@@ -222,13 +157,85 @@ python test_db.py
 ## Description
 {KAVIA_PROJECT_DESCRIPTION}
 '''
-    (sqlite_path / "README.md").write_text(readme_content)
 
-    return templates_path
+TEMPLATE_FILES = {
+    "init_db.py": INIT_DB_CONTENT,
+    "db_shell.py": DB_SHELL_CONTENT,
+    "test_db.py": TEST_DB_CONTENT,
+    "README.md": README_CONTENT,
+}
+
+
+TEMPLATE_PATH = "__SQLITE_PATH__"
+CONFIG = {
+    'configure_environment': {
+        'command': 'python init_db.py',
+        'working_directory': TEMPLATE_PATH
+    },
+    'build_cmd': {
+        'command': 'python init_db.py',
+        'working_directory': '{KAVIA_PROJECT_DIRECTORY}'
+    },
+    'install_dependencies': {
+        'command': 'ls',
+        'working_directory': TEMPLATE_PATH
+    },
+    'env': {
+        'environment_initialized': True,
+        'python_version': '3.8+'
+    },
+    'init_files': [],
+    'init_minimal': 'SQLite database initialized',
+    'run_tool': {
+        'command': 'python db_shell.py',
+        'working_directory': '{KAVIA_PROJECT_DIRECTORY}'
+    },
+    'test_tool': {
+        'command': 'python test_db.py',
+        'working_directory': '{KAVIA_PROJECT_DIRECTORY}'
+    },
+    'init_style': 'database',
+    'entry_point_url': 'sqlite:///{KAVIA_PROJECT_DIRECTORY}/{KAVIA_DB_NAME}',
+    'linter': {
+        'script_content': '#!/bin/bash\necho "No linting required for database configuration"'
+    },
+    'pre_processing': {
+        'script': ''
+    },
+    'post_processing': {
+        'script': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\npython init_db.py\necho "SQLite database is ready at {KAVIA_DB_NAME}"'
+    }
+}
+CONFIG_YML = dump_config(CONFIG)
+
+# Post-processing script that writes the project name to a marker file in the generated project
+NAME_MARKER_SCRIPT = '#!/bin/bash\necho "test-sqlite-db" > {KAVIA_PROJECT_DIRECTORY}/post_processing_executed\n'
+
+# Matches the DB_NAME assignment in a generated init_db.py
+DB_NAME_RE = re.compile(r'DB_NAME = ["\']([^"\']+)["\']')
+
+
+@pytest.fixture(scope="session")
+def template_dir(request, tmp_path_factory):
+    """Create a mock template directory with necessary files.
+
+    The directory is shared by the whole session, so tests must not modify it.
+    Tests can pass `{'post_script': ...}` through indirect parametrization to
+    get a separate template with a different post-processing script.
+    """
+    post_script = requested_post_script(request)
+    config_yml = CONFIG_YML if post_script is None else dump_config(CONFIG, post_script)
+    sqlite_path = create_template_root(tmp_path_factory, "sqlite", config_yml, TEMPLATE_PATH)
+
+    # Create mock template files
+    for relative_path, content in TEMPLATE_FILES.items():
+        (sqlite_path / relative_path).write_bytes(content)
+
+    return sqlite_path.parent
 
 
 @pytest.fixture
-def project_config(temp_dir):
+def project_config(tmp_path):
     """Create a test project configuration."""
     return ProjectConfig(
         name="test-sqlite-db",
@@ -236,18 +243,16 @@ def project_config(temp_dir):
         description="Test SQLite Database",
         author="Test Author",
         project_type=ProjectType.SQLITE,
-        output_path=temp_dir / "output",
+        output_path=tmp_path / "output",
         parameters={
             'database_name': 'test_app.db'
         }
     )
 
 
-def test_sqlite_init_info(template_dir, project_config):
+def test_sqlite_init_info(template_dir, project_config, initializer_factory):
     """Test that getting template init info works correctly."""
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.SQLITE, SQLiteTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.SQLITE, SQLiteTemplate)
     template = initializer.template_factory.create_template(project_config)
     
     init_info = template.get_init_info()
@@ -257,11 +262,10 @@ def test_sqlite_init_info(template_dir, project_config):
     assert init_info.configure_environment.command == 'python init_db.py'
 
 
-def test_project_initialization(template_dir, project_config):
+@pytest.mark.usefixtures("no_post_processing")
+def test_project_initialization(template_dir, project_config, initializer_factory):
     """Test basic project initialization."""
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.SQLITE, SQLiteTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.SQLITE, SQLiteTemplate)
 
     success = initializer.initialize_project(project_config)
     assert success
@@ -273,74 +277,60 @@ def test_project_initialization(template_dir, project_config):
     assert (output_dir / "README.md").exists()
 
     # Verify content replacement in init_db.py
-    init_db_content = (output_dir / "init_db.py").read_text()
-    assert 'test_app.db' in init_db_content
-    assert 'test-sqlite-db' in init_db_content
-    assert 'Test Author' in init_db_content
-    assert '1.0.0' in init_db_content
+    init_db_content = (output_dir / "init_db.py").read_bytes()
+    assert b'test_app.db' in init_db_content
+    assert b'test-sqlite-db' in init_db_content
+    assert b'Test Author' in init_db_content
+    assert b'1.0.0' in init_db_content
 
     # Verify content replacement in README.md
-    readme_content = (output_dir / "README.md").read_text()
-    assert 'test-sqlite-db' in readme_content
-    assert 'Test Author' in readme_content
-    assert 'test_app.db' in readme_content
-    assert 'Test SQLite Database' in readme_content
+    readme_content = (output_dir / "README.md").read_bytes()
+    assert b'test-sqlite-db' in readme_content
+    assert b'Test Author' in readme_content
+    assert b'test_app.db' in readme_content
+    assert b'Test SQLite Database' in readme_content
 
 
-def test_database_creation(template_dir, project_config):
+@pytest.mark.usefixtures("no_post_processing")
+def test_database_creation(template_dir, project_config, initializer_factory, capsys):
     """Test that the SQLite database can be created successfully."""
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.SQLITE, SQLiteTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.SQLITE, SQLiteTemplate)
 
     success = initializer.initialize_project(project_config)
     assert success
 
-    # Execute init_db.py to create the database
+    # Execute init_db.py to create the database; the script only uses sqlite3, os
+    # and print, so it runs in-process instead of paying for a new interpreter
     output_dir = project_config.output_path
     init_script = output_dir / "init_db.py"
-    
-    # Make the script executable and run it
-    import subprocess
-    result = subprocess.run(
-        ['python', str(init_script)],
-        cwd=str(output_dir),
-        capture_output=True,
-        text=True
-    )
-    
-    assert result.returncode == 0
-    assert 'SQLite database created: test_app.db' in result.stdout
+    with contextlib.chdir(output_dir):
+        runpy.run_path(str(init_script), run_name="__main__")
+
+    assert 'SQLite database created: test_app.db' in capsys.readouterr().out
 
     # Verify database file exists
     db_path = output_dir / 'test_app.db'
     assert db_path.exists()
 
-    # Verify database structure
-    conn = sqlite3.connect(str(db_path))
-    cursor = conn.cursor()
-    
-    # Check table exists
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='app_info';")
-    tables = cursor.fetchall()
-    assert len(tables) == 1
-    assert tables[0][0] == 'app_info'
-    
-    # Check data was inserted
-    cursor.execute("SELECT * FROM app_info ORDER BY key;")
-    rows = cursor.fetchall()
+    # Verify database structure; the file is only read, so open it read-only and
+    # immutable to skip journal setup and locking
+    conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro&immutable=1", uri=True)
+    try:
+        # Querying app_info fails if the table wasn't created
+        rows = conn.execute("SELECT key, value FROM app_info").fetchall()
+    finally:
+        conn.close()
     assert len(rows) == 4  # Updated to expect 4 rows (including description)
-    
+
     # Verify the data
-    data = {row[1]: row[2] for row in rows}  # key: value mapping
+    data = dict(rows)  # key: value mapping
     assert data['author'] == 'Test Author'
     assert data['project_name'] == 'test-sqlite-db'
     assert data['version'] == '1.0.0'
-    
-    conn.close()
 
 
-def test_default_database_name(template_dir, temp_dir):
+@pytest.mark.usefixtures("no_post_processing")
+def test_default_database_name(template_dir, tmp_path, initializer_factory):
     """Test that default database name is generated correctly when not specified."""
     config = ProjectConfig(
         name="my-awesome-app",
@@ -348,25 +338,18 @@ def test_default_database_name(template_dir, temp_dir):
         description="Test SQLite Database without explicit db name",
         author="Test Author",
         project_type=ProjectType.SQLITE,
-        output_path=temp_dir / "output",
+        output_path=tmp_path / "output",
         parameters={}  # No database_name parameter
     )
     
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.SQLITE, SQLiteTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.SQLITE, SQLiteTemplate)
 
     success = initializer.initialize_project(config)
     assert success
 
     # Check that some form of database name is used
     init_db_content = (config.output_path / "init_db.py").read_text()
-    
-    # Print content for debugging
-    print("=== DEBUG: init_db.py content ===")
-    print(init_db_content)
-    print("=== END DEBUG ===")
-    
+
     # Look for various possible default database name patterns
     possible_names = [
         'my_awesome_app.db',
@@ -382,11 +365,9 @@ def test_default_database_name(template_dir, temp_dir):
     # If none of the expected patterns are found, check what's actually in DB_NAME
     if not name_found:
         # Extract the DB_NAME value from the content
-        import re
-        db_name_match = re.search(r'DB_NAME = ["\']([^"\']+)["\']', init_db_content)
+        db_name_match = DB_NAME_RE.search(init_db_content)
         if db_name_match:
             actual_db_name = db_name_match.group(1)
-            print(f"Actual DB_NAME found: {actual_db_name}")
             # Accept any non-empty database name that looks reasonable
             assert actual_db_name and len(actual_db_name) > 0 and actual_db_name != '{KAVIA_DB_NAME}'
         else:
@@ -396,100 +377,30 @@ def test_default_database_name(template_dir, temp_dir):
         assert True  # One of the expected patterns was found
 
 
-def test_post_processing_execution(template_dir, project_config, temp_dir):
+@pytest.mark.parametrize('template_dir', [{'post_script': NAME_MARKER_SCRIPT}], indirect=True)
+def test_post_processing_execution(template_dir, project_config, initializer_factory):
     """Test that post-processing script is executed."""
-    # Create a test post-processing script that creates a marker file
-    config_path = template_dir / "sqlite" / "config.yml"
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
-
-    marker_path = temp_dir / "post_processing_executed"
-    config['post_processing']['script'] = f"""#!/bin/bash
-    touch {marker_path}
-    echo "test-sqlite-db" > {marker_path}
-    """
-
-    with open(config_path, 'w') as f:
-        yaml.dump(config, f)
-
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.SQLITE, SQLiteTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.SQLITE, SQLiteTemplate)
+    done = threading.Event()
+    results = []
+    initializer.register_post_process_hook(lambda succeeded: (results.append(succeeded), done.set()))
 
     success = initializer.initialize_project(project_config)
     assert success
     
-    # Wait for post-processing to complete
-    assert initializer.wait_for_post_process_completed(timeout=10)
+    # Wait for the completion hook instead of polling the status file
+    assert done.wait(10)
+    assert results == [True]
     
     # Check marker file exists and has correct content
+    marker_path = project_config.output_path / "post_processing_executed"
     assert marker_path.exists()
     assert marker_path.read_text().strip() == "test-sqlite-db"
 
 
-def test_config_file_loading(temp_dir):
-    """Test loading project configuration from JSON file."""
-    config_data = {
-        "name": "json-config-test",
-        "version": "1.0.0",
-        "description": "Test from JSON config",
-        "author": "Test Author",
-        "project_type": "sqlite",
-        "output_path": str(temp_dir / "output"),
-        "parameters": {
-            "database_name": "config_test.db"
-        }
-    }
-
-    config_file = temp_dir / "config.json"
-    with open(config_file, 'w') as f:
-        json.dump(config_data, f)
-
-    config = ProjectInitializer.load_config(config_file)
-    assert config.name == "json-config-test"
-    assert config.project_type == ProjectType.SQLITE
-    assert config.parameters["database_name"] == "config_test.db"
-
-
-def test_template_variable_replacement(template_dir, project_config):
-    """Test template variable replacement in file contents."""
-    test_file = template_dir / "sqlite" / "test.txt"
-    test_content = """
-    Project: {KAVIA_TEMPLATE_PROJECT_NAME}
-    Author: {KAVIA_PROJECT_AUTHOR}
-    Version: {KAVIA_PROJECT_VERSION}
-    Description: {KAVIA_PROJECT_DESCRIPTION}
-    Database: {KAVIA_DB_NAME}
-    Directory: {KAVIA_PROJECT_DIRECTORY}
-    """
-    test_file.write_text(test_content)
-
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.SQLITE, SQLiteTemplate)
-
-    success = initializer.initialize_project(project_config)
-    assert success
-
-    output_file = project_config.output_path / "test.txt"
-    assert output_file.exists()
-
-    content = output_file.read_text()
-    assert 'test-sqlite-db' in content
-    assert 'Test Author' in content
-    assert '1.0.0' in content
-    assert 'Test SQLite Database' in content
-    assert 'test_app.db' in content
-    # Check for project directory replacement instead of './data'
-    assert (str(project_config.output_path) in content or 
-            '{KAVIA_PROJECT_DIRECTORY}' in content)
-
-
-def test_sqlite_specific_features(template_dir, project_config):
+def test_sqlite_specific_features(template_dir, project_config, initializer_factory):
     """Test SQLite-specific features like no authentication required."""
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.SQLITE, SQLiteTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.SQLITE, SQLiteTemplate)
 
     # SQLite shouldn't need database_user or database_password for connection
     template = initializer.template_factory.create_template(project_config)
@@ -506,11 +417,9 @@ def test_sqlite_specific_features(template_dir, project_config):
     assert replacements['KAVIA_DB_PORT'] == '5000' or replacements['KAVIA_DB_PORT'] == ''
 
 
-def test_entry_point_url(template_dir, project_config):
+def test_entry_point_url(template_dir, project_config, initializer_factory):
     """Test that the entry point URL is correctly generated."""
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.SQLITE, SQLiteTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.SQLITE, SQLiteTemplate)
 
     template = initializer.template_factory.create_template(project_config)
     init_info = template.get_init_info()
@@ -0,0 +1,55 @@
+import pytest
+
+from universalinit.templateconfig import ProjectConfig, ProjectType
+from universalinit.universalinit import QwikTemplate
+
+from _template_helpers import create_template_root, dump_config
+
+
+TEMPLATE_PATH = "__HELPER_PATH__"
+CONFIG = {
+    'build_cmd': {'command': 'true', 'working_directory': TEMPLATE_PATH},
+    'install_dependencies': {'command': 'true', 'working_directory': TEMPLATE_PATH},
+    'env': {'environment_initialized': True},
+    'init_minimal': 'Template helper test template',
+    'run_tool': {'command': 'true', 'working_directory': TEMPLATE_PATH},
+    'test_tool': {'command': 'true', 'working_directory': TEMPLATE_PATH},
+    'linter': {'script_content': ''},
+}
+
+
+class BackslashPathFactory:
+    """Stand-in for tmp_path_factory whose directories have backslashes in their path."""
+
+    def __init__(self, base_path):
+        self.base_path = base_path
+
+    def mktemp(self, name):
+        path = self.base_path / f"{name}\\dir"
+        try:
+            path.mkdir(parents=True)
+        except OSError:
+            pytest.skip("the filesystem can't represent a path with a backslash")
+        return path
+
+
+def test_create_template_root_escapes_backslashes(tmp_path, initializer_factory):
+    """Test that a template path with backslashes survives being spliced into config.yml."""
+    template_path = create_template_root(BackslashPathFactory(tmp_path), "qwik", dump_config(CONFIG), TEMPLATE_PATH)
+    assert "\\" in str(template_path)
+
+    project_config = ProjectConfig(
+        name="helper-test",
+        version="1.0.0",
+        description="Template helper test",
+        author="Test Author",
+        project_type=ProjectType.QWIK,
+        output_path=tmp_path / "output",
+        parameters={}
+    )
+    initializer = initializer_factory(template_path.parent, ProjectType.QWIK, QwikTemplate)
+    template = initializer.template_factory.create_template(project_config)
+
+    init_info = template.get_init_info()
+    assert init_info.build_cmd.working_directory == str(template_path)
+    assert init_info.run_tool.working_directory == str(template_path)
@@ -1,81 +1,81 @@
 import pytest
-from pathlib import Path
-import shutil
-import tempfile
-import yaml
-import json
 
 from universalinit.templateconfig import ProjectConfig, ProjectType, TemplateInitInfo
-from universalinit.universalinit import ProjectInitializer, TemplateProvider, TypeScriptTemplate
-
-
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test outputs."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+from universalinit.universalinit import TypeScriptTemplate
+
+from _template_helpers import MARKER_SCRIPT, create_template_root, dump_config, requested_post_script
+
+
+TEMPLATE_DIRS = ("src",)
+TEMPLATE_FILES = {
+    "src/main.ts": b"// ${KAVIA_TEMPLATE_PROJECT_NAME}",
+    "package.json": b'{"name": "${KAVIA_TEMPLATE_PROJECT_NAME}"}',
+    "tsconfig.json": b'{"compilerOptions": {}}',
+}
+
+TEMPLATE_PATH = "__TYPESCRIPT_PATH__"
+CONFIG = {
+    'configure_environment': {
+        'command': 'npm install',
+        'working_directory': TEMPLATE_PATH
+    },
+    'build_cmd': {
+        'command': 'npm install && npm run build',
+        'working_directory': TEMPLATE_PATH
+    },
+    'install_dependencies': {
+        'command': 'npm install',
+        'working_directory': TEMPLATE_PATH
+    },
+    'env': {
+        'environment_initialized': True,
+        'node_version': '18.19.1',
+        'npm_version': '9.2.0'
+    },
+    'init_files': [],
+    'init_minimal': 'Minimal TypeScript application initialized',
+    'run_tool': {
+        'command': 'npm run dev',
+        'working_directory': TEMPLATE_PATH
+    },
+    'test_tool': {
+        'command': 'npm run build',
+        'working_directory': TEMPLATE_PATH
+    },
+    'init_style': '',
+    'linter': {
+        'script_content': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\nnpm run build\nEXIT_CODE=$?\nif [ $EXIT_CODE -ne 0 ]; then\n\t   exit 1\nfi'
+    },
+    'post_processing': {
+        'script': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\nnpm install'
+    }
+}
+CONFIG_YML = dump_config(CONFIG)
 
 
-@pytest.fixture
-def template_dir(temp_dir):
-    """Create a mock template directory with necessary files."""
-    templates_path = temp_dir / "templates"
-    typescript_path = templates_path / "typescript"
-    typescript_path.mkdir(parents=True)
-
-    # Create mock config.yml
-    config = {
-        'configure_environment': {
-            'command': 'npm install',
-            'working_directory': str(typescript_path)
-        },
-        'build_cmd': {
-            'command': 'npm install && npm run build',
-            'working_directory': str(typescript_path)
-        },
-        'install_dependencies': {
-            'command': 'npm install',
-            'working_directory': str(typescript_path)
-        },
-        'env': {
-            'environment_initialized': True,
-            'node_version': '18.19.1',
-            'npm_version': '9.2.0'
-        },
-        'init_files': [],
-        'init_minimal': 'Minimal TypeScript application initialized',
-        'run_tool': {
-            'command': 'npm run dev',
-            'working_directory': str(typescript_path)
-        },
-        'test_tool': {
-            'command': 'npm run build',
-            'working_directory': str(typescript_path)
-        },
-        'init_style': '',
-        'linter': {
-            'script_content': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\nnpm run build\nEXIT_CODE=$?\nif [ $EXIT_CODE -ne 0 ]; then\n\t   exit 1\nfi'
-        },
-        'post_processing': {
-            'script': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\nnpm install'
-        }
-    }
+@pytest.fixture(scope="session")
+def template_dir(request, tmp_path_factory):
+    """Create a mock template directory with necessary files.
 
-    with open(typescript_path / "config.yml", 'w') as f:
-        yaml.dump(config, f)
+    The directory is shared by the whole session, so tests must not modify it.
+    Tests can pass `{'post_script': ...}` through indirect parametrization to
+    get a separate template with a different post-processing script.
+    """
+    post_script = requested_post_script(request)
+    config_yml = CONFIG_YML if post_script is None else dump_config(CONFIG, post_script)
+    typescript_path = create_template_root(tmp_path_factory, "typescript", config_yml, TEMPLATE_PATH)
 
     # Create some mock template files
-    (typescript_path / "src").mkdir()
-    (typescript_path / "src" / "main.ts").write_text("// ${KAVIA_TEMPLATE_PROJECT_NAME}")
-    (typescript_path / "package.json").write_text('{"name": "${KAVIA_TEMPLATE_PROJECT_NAME}"}')
-    (typescript_path / "tsconfig.json").write_text('{"compilerOptions": {}}')
+    for directory in TEMPLATE_DIRS:
+        (typescript_path / directory).mkdir(parents=True, exist_ok=True)
+    for relative_path, content in TEMPLATE_FILES.items():
+        (typescript_path / relative_path).write_bytes(content)
 
-    return templates_path
+    return typescript_path.parent
 
 
 @pytest.fixture
-def project_config(temp_dir):
+def project_config(tmp_path):
     """Create a test project configuration."""
     return ProjectConfig(
         name="test-ts-app",
@@ -83,16 +83,14 @@ def project_config(temp_dir):
         description="Test TypeScript Application",
         author="Test Author",
         project_type=ProjectType.TYPESCRIPT,
-        output_path=temp_dir / "output",
+        output_path=tmp_path / "output",
         parameters={}
     )
 
 
-def test_typescript_init_info(template_dir, project_config):
+def test_typescript_init_info(template_dir, project_config, initializer_factory):
     """Test that getting template init info works correctly."""
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.TYPESCRIPT, TypeScriptTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.TYPESCRIPT, TypeScriptTemplate)
     template = initializer.template_factory.create_template(project_config)
     
     init_info = template.get_init_info()
@@ -103,11 +101,10 @@ def test_typescript_init_info(template_dir, project_config):
 
 
 
-def test_project_initialization(template_dir, project_config):
+@pytest.mark.usefixtures("no_post_processing")
+def test_project_initialization(template_dir, project_config, initializer_factory):
     """Test basic project initialization."""
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.TYPESCRIPT, TypeScriptTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.TYPESCRIPT, TypeScriptTemplate)
 
     success = initializer.initialize_project(project_config)
     assert success
@@ -120,82 +117,19 @@ def test_project_initialization(template_dir, project_config):
     assert (output_dir / "tsconfig.json").exists()
 
     # Verify content replacement
-    main_content = (output_dir / "src" / "main.ts").read_text()
-    assert "test-ts-app" in main_content
+    main_content = (output_dir / "src" / "main.ts").read_bytes()
+    assert b"test-ts-app" in main_content
 
-    package_json = (output_dir / "package.json").read_text()
-    assert "test-ts-app" in package_json
+    package_json = (output_dir / "package.json").read_bytes()
+    assert b"test-ts-app" in package_json
 
 
-def test_post_processing_execution(template_dir, project_config, temp_dir):
+@pytest.mark.parametrize('template_dir', [{'post_script': MARKER_SCRIPT}], indirect=True)
+def test_post_processing_execution(template_dir, project_config, initializer_factory):
     """Test that post-processing script is executed."""
-    # Create a test post-processing script that creates a marker file
-    config_path = template_dir / "typescript" / "config.yml"
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
-
-    marker_path = temp_dir / "post_processing_executed"
-    config['post_processing']['script'] = f"""#!/bin/bash
-    touch {marker_path}
-    """
-
-    with open(config_path, 'w') as f:
-        yaml.dump(config, f)
-
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.TYPESCRIPT, TypeScriptTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.TYPESCRIPT, TypeScriptTemplate)
 
     success = initializer.initialize_project(project_config)
     assert success
     assert initializer.wait_for_post_process_completed()
-    assert marker_path.exists()
-
-
-def test_config_file_loading(temp_dir):
-    """Test loading project configuration from JSON file."""
-    config_data = {
-        "name": "json-config-test",
-        "version": "1.0.0",
-        "description": "Test from JSON config",
-        "author": "Test Author",
-        "project_type": "typescript",
-        "output_path": str(temp_dir / "output"),
-        "parameters": {}
-    }
-
-    config_file = temp_dir / "config.json"
-    with open(config_file, 'w') as f:
-        json.dump(config_data, f)
-
-    config = ProjectInitializer.load_config(config_file)
-    assert config.name == "json-config-test"
-    assert config.project_type == ProjectType.TYPESCRIPT
-
-
-def test_template_variable_replacement(template_dir, project_config):
-    """Test template variable replacement in file contents."""
-    test_file = template_dir / "typescript" / "test.txt"
-    test_content = """
-    Project: ${KAVIA_TEMPLATE_PROJECT_NAME}
-    Author: {KAVIA_PROJECT_AUTHOR}
-    Version: ${KAVIA_PROJECT_VERSION}
-    Description: {KAVIA_PROJECT_DESCRIPTION}
-    """
-    test_file.write_text(test_content)
-
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.TYPESCRIPT, TypeScriptTemplate)
-
-    success = initializer.initialize_project(project_config)
-    assert success
-
-    output_file = project_config.output_path / "test.txt"
-    assert output_file.exists()
-
-    content = output_file.read_text()
-    assert project_config.name in content
-    assert project_config.author in content
-    assert project_config.version in content
-    assert project_config.description in content
+    assert (project_config.output_path / "post_processing_executed").exists()
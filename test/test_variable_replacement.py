@@ -0,0 +1,154 @@
+import pytest
+from collections import namedtuple
+
+from universalinit.templateconfig import ProjectConfig, ProjectType
+from universalinit.universalinit import (
+    NextJSTemplate, NuxtTemplate, PostgreSQLTemplate, QwikTemplate, ReactNativeTemplate, RemixTemplate,
+    RemotionTemplate, SlidevTemplate, SQLiteTemplate, TypeScriptTemplate, ViteTemplate, VueTemplate
+)
+
+from _template_helpers import dump_config
+
+
+# Smallest config.yml the template config provider accepts; without processing scripts nothing is run
+CONFIG_YML = dump_config({
+    'build_cmd': {'command': 'true', 'working_directory': '{KAVIA_PROJECT_DIRECTORY}'},
+    'install_dependencies': {'command': 'true', 'working_directory': '{KAVIA_PROJECT_DIRECTORY}'},
+    'env': {'environment_initialized': True},
+    'init_minimal': 'Variable replacement test template',
+    'run_tool': {'command': 'true', 'working_directory': '{KAVIA_PROJECT_DIRECTORY}'},
+    'test_tool': {'command': 'true', 'working_directory': '{KAVIA_PROJECT_DIRECTORY}'},
+    'linter': {'script_content': ''},
+})
+
+TEST_CONTENT = """
+Project: ${KAVIA_TEMPLATE_PROJECT_NAME}
+Author: {KAVIA_PROJECT_AUTHOR}
+Version: ${KAVIA_PROJECT_VERSION}
+Description: {KAVIA_PROJECT_DESCRIPTION}
+"""
+
+# extra_content is appended to test.txt, expected lists values that must show up in addition to the project metadata
+Variant = namedtuple('Variant', 'project_type template_class name parameters extra_content expected')
+
+VARIANTS = [
+    Variant(
+        ProjectType.NEXTJS, NextJSTemplate, "test-nextjs-app",
+        {"typescript": True, "styling_solution": "tailwind"},
+        "TypeScript: ${KAVIA_USE_TYPESCRIPT}\nStyling: ${KAVIA_STYLING_SOLUTION}\n",
+        ['true', 'tailwind'],
+    ),
+    Variant(ProjectType.NUXT, NuxtTemplate, "test-nuxt-app", {}, "", []),
+    Variant(
+        ProjectType.POSTGRESQL, PostgreSQLTemplate, "test-postgres-db",
+        {
+            'database_name': 'test_db',
+            'database_user': 'testuser',
+            'database_password': 'testpass',
+            'database_port': 15432
+        },
+        "Database: {KAVIA_DB_NAME}\nUser: {KAVIA_DB_USER}\nPort: {KAVIA_DB_PORT}\n",
+        ['test_db', 'testuser', '15432'],
+    ),
+    Variant(ProjectType.QWIK, QwikTemplate, "test-qwik-app", {}, "", []),
+    Variant(ProjectType.REACT_NATIVE, ReactNativeTemplate, "test-reactnative-app", {}, "", []),
+    Variant(
+        ProjectType.REMIX, RemixTemplate, "test-remix-app",
+        {"typescript": True, "styling_solution": "tailwind"},
+        "", [],
+    ),
+    Variant(ProjectType.REMOTION, RemotionTemplate, "test-remotion-app", {}, "", []),
+    Variant(ProjectType.SLIDEV, SlidevTemplate, "test-slidev-deck", {}, "", []),
+    Variant(
+        ProjectType.SQLITE, SQLiteTemplate, "test-sqlite-db",
+        {'database_name': 'test_app.db'},
+        "Database: {KAVIA_DB_NAME}\nDirectory: {KAVIA_PROJECT_DIRECTORY}\n",
+        ['test_app.db'],
+    ),
+    Variant(ProjectType.TYPESCRIPT, TypeScriptTemplate, "test-ts-app", {}, "", []),
+    Variant(
+        ProjectType.VITE, ViteTemplate, "test-vite-app",
+        {"typescript": True, "framework": "react"},
+        "", [],
+    ),
+    Variant(ProjectType.VUE, VueTemplate, "test-vue-app", {}, "", []),
+]
+
+# Number of placeholder files in the many-files template, enough to surface per-file or per-key regressions
+MANY_FILES = 50
+
+
+@pytest.fixture(scope="session")
+def template_dir(tmp_path_factory):
+    """Create a template directory holding a minimal template per variant."""
+    templates_path = tmp_path_factory.mktemp("replacement") / "templates"
+    for variant in VARIANTS:
+        variant_path = templates_path / variant.project_type.value
+        variant_path.mkdir(parents=True)
+        (variant_path / "config.yml").write_text(CONFIG_YML)
+        (variant_path / "test.txt").write_text(TEST_CONTENT + variant.extra_content)
+    return templates_path
+
+
+@pytest.fixture(scope="session")
+def many_files_template_dir(tmp_path_factory):
+    """Create a template directory whose vite template holds MANY_FILES copies of the placeholder file."""
+    vite_path = tmp_path_factory.mktemp("replacement-many") / "templates" / ProjectType.VITE.value
+    vite_path.mkdir(parents=True)
+    (vite_path / "config.yml").write_text(CONFIG_YML)
+    content = TEST_CONTENT.encode()
+    for i in range(MANY_FILES):
+        (vite_path / f"test_{i}.txt").write_bytes(content)
+    return vite_path.parent
+
+
+@pytest.mark.parametrize('variant', VARIANTS, ids=lambda variant: variant.project_type.value)
+def test_template_variable_replacement(template_dir, tmp_path, initializer_factory, variant):
+    """Test template variable replacement in file contents."""
+    project_config = ProjectConfig(
+        name=variant.name,
+        version="1.0.0",
+        description="Test Application",
+        author="Test Author",
+        project_type=variant.project_type,
+        output_path=tmp_path / "output",
+        parameters=dict(variant.parameters)
+    )
+    initializer = initializer_factory(template_dir, variant.project_type, variant.template_class)
+
+    success = initializer.initialize_project(project_config)
+    assert success
+
+    output_file = project_config.output_path / "test.txt"
+    assert output_file.exists()
+
+    content = output_file.read_bytes()
+    expected = [project_config.name, project_config.author, project_config.version, project_config.description]
+    for value in expected + variant.expected:
+        assert value.encode() in content
+    assert b"KAVIA_" not in content
+
+
+def test_template_variable_replacement_many_files(many_files_template_dir, tmp_path, initializer_factory):
+    """Test that placeholders are replaced in every file of a template with many files."""
+    project_config = ProjectConfig(
+        name="test-vite-app",
+        version="1.0.0",
+        description="Test Application",
+        author="Test Author",
+        project_type=ProjectType.VITE,
+        output_path=tmp_path / "output",
+        parameters={}
+    )
+    initializer = initializer_factory(many_files_template_dir, ProjectType.VITE, ViteTemplate)
+
+    success = initializer.initialize_project(project_config)
+    assert success
+
+    output_files = sorted(project_config.output_path.glob("test_*.txt"))
+    assert len(output_files) == MANY_FILES
+    for output_file in output_files:
+        content = output_file.read_bytes()
+        for value in (project_config.name, project_config.author, project_config.version, project_config.description):
+            assert value.encode() in content
+        assert b"KAVIA_" not in content
@@ -1,102 +1,112 @@
 import pytest
+from dataclasses import replace
 from pathlib import Path
-import shutil
-import tempfile
-import yaml
-import json
+from types import MappingProxyType
 
 from universalinit.templateconfig import ProjectConfig, ProjectType, TemplateInitInfo
-from universalinit.universalinit import ProjectInitializer, TemplateProvider, ViteTemplate
-
+from universalinit.universalinit import ViteTemplate
+
+from _template_helpers import MARKER_SCRIPT, create_template_root, dump_config, requested_post_script
+
+
+BASE_PROJECT_CONFIG = ProjectConfig(
+    name="test-vite-app",
+    version="1.0.0",
+    description="Test Vite Application",
+    author="Test Author",
+    project_type=ProjectType.VITE,
+    output_path=Path("output"),
+    parameters=MappingProxyType({
+        "typescript": True,
+        "framework": "react"
+    })
+)
+
+
+TEMPLATE_DIRS = ("src",)
+TEMPLATE_FILES = {
+    "src/main.js": b"// ${KAVIA_TEMPLATE_PROJECT_NAME}",
+    "package.json": b'{"name": "${KAVIA_TEMPLATE_PROJECT_NAME}"}',
+    "index.html": b'<!DOCTYPE html>\n<title>${KAVIA_TEMPLATE_PROJECT_NAME}</title>',
+}
+
+
+TEMPLATE_PATH = "__VITE_PATH__"
+CONFIG = {
+    'configure_environment': {
+        'command': 'npm install',
+        'working_directory': TEMPLATE_PATH
+    },
+    'build_cmd': {
+        'command': 'npm install && npm run build',
+        'working_directory': TEMPLATE_PATH
+    },
+    'install_dependencies': {
+        'command': 'npm install',
+        'working_directory': TEMPLATE_PATH
+    },
+    'env': {
+        'environment_initialized': True,
+        'node_version': '18.19.1',
+        'npm_version': '9.2.0'
+    },
+    'init_files': [],
+    'init_minimal': 'Minimal Vite application initialized',
+    'run_tool': {
+        'command': 'npm run dev',
+        'working_directory': TEMPLATE_PATH
+    },
+    'test_tool': {
+        'command': 'npm run test',
+        'working_directory': TEMPLATE_PATH
+    },
+    'init_style': '',
+    'linter': {
+        'script_content': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\nnpx eslint "$@"\nESLINT_EXIT_CODE=$?\nnpm run build\nBUILD_EXIT_CODE=$?\nif [ $ESLINT_EXIT_CODE -ne 0 ] || [ $BUILD_EXIT_CODE -ne 0 ]; then\n\t   exit 1\nfi'
+    },
+    'post_processing': {
+        'script': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\nnpm install'
+    }
+}
+CONFIG_YML = dump_config(CONFIG)
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test outputs."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
 
+@pytest.fixture(scope="session")
+def template_dir(request, tmp_path_factory):
+    """Create a mock template directory with necessary files.
 
-@pytest.fixture
-def template_dir(temp_dir):
-    """Create a mock template directory with necessary files."""
-    templates_path = temp_dir / "templates"
-    vite_path = templates_path / "vite"
-    vite_path.mkdir(parents=True)
-
-    # Create mock config.yml
-    config = {
-        'configure_environment': {
-            'command': 'npm install',
-            'working_directory': str(vite_path)
-        },
-        'build_cmd': {
-            'command': 'npm install && npm run build',
-            'working_directory': str(vite_path)
-        },
-        'install_dependencies': {
-            'command': 'npm install',
-            'working_directory': str(vite_path)
-        },
-        'env': {
-            'environment_initialized': True,
-            'node_version': '18.19.1',
-            'npm_version': '9.2.0'
-        },
-        'init_files': [],
-        'init_minimal': 'Minimal Vite application initialized',
-        'run_tool': {
-            'command': 'npm run dev',
-            'working_directory': str(vite_path)
-        },
-        'test_tool': {
-            'command': 'npm run test',
-            'working_directory': str(vite_path)
-        },
-        'init_style': '',
-        'linter': {
-            'script_content': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\nnpx eslint "$@"\nESLINT_EXIT_CODE=$?\nnpm run build\nBUILD_EXIT_CODE=$?\nif [ $ESLINT_EXIT_CODE -ne 0 ] || [ $BUILD_EXIT_CODE -ne 0 ]; then\n\t   exit 1\nfi'
-        },
-        'post_processing': {
-            'script': '#!/bin/bash\ncd {KAVIA_PROJECT_DIRECTORY}\nnpm install'
-        }
-    }
-
-    with open(vite_path / "config.yml", 'w') as f:
-        yaml.dump(config, f)
+    The directory is shared by the whole session, so tests must not modify it.
+    Tests can pass `{'post_script': ...}` through indirect parametrization to
+    get a separate template with a different post-processing script.
+    """
+    post_script = requested_post_script(request)
+    config_yml = CONFIG_YML if post_script is None else dump_config(CONFIG, post_script)
+    vite_path = create_template_root(tmp_path_factory, "vite", config_yml, TEMPLATE_PATH)
 
     # Create some mock template files
-    (vite_path / "src").mkdir()
-    (vite_path / "src" / "main.js").write_text("// ${KAVIA_TEMPLATE_PROJECT_NAME}")
-    (vite_path / "package.json").write_text('{"name": "${KAVIA_TEMPLATE_PROJECT_NAME}"}')
-    (vite_path / "index.html").write_text('<!DOCTYPE html>\n<title>${KAVIA_TEMPLATE_PROJECT_NAME}</title>')
+    for directory in TEMPLATE_DIRS:
+        (vite_path / directory).mkdir(parents=True, exist_ok=True)
+    for relative_path, content in TEMPLATE_FILES.items():
+        (vite_path / relative_path).write_bytes(content)
 
-    return templates_path
+    return vite_path.parent
 
 
 @pytest.fixture
-def project_config(temp_dir):
+def project_config(tmp_path):
     """Create a test project configuration."""
-    return ProjectConfig(
-        name="test-vite-app",
-        version="1.0.0",
-        description="Test Vite Application",
-        author="Test Author",
-        project_type=ProjectType.VITE,
-        output_path=temp_dir / "output",
-        parameters={
-            "typescript": True,
-            "framework": "react"
-        }
+    return replace(
+        BASE_PROJECT_CONFIG,
+        output_path=tmp_path / "output",
+        parameters=dict(BASE_PROJECT_CONFIG.parameters),
     )
 
 
-def test_vite_init_info(template_dir, project_config):
+def test_vite_init_info(template_dir, initializer_factory):
     """Test that getting template init info works correctly."""
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.VITE, ViteTemplate)
-    template = initializer.template_factory.create_template(project_config)
+    initializer = initializer_factory(template_dir, ProjectType.VITE, ViteTemplate)
+    # Nothing is generated, so the shared base config can be used as is
+    template = initializer.template_factory.create_template(BASE_PROJECT_CONFIG)
     
     init_info = template.get_init_info()
 
@@ -105,11 +115,10 @@ def test_vite_init_info(template_dir, project_config):
     assert init_info.configure_environment.command == 'npm install'
 
 
-def test_project_initialization(template_dir, project_config):
+@pytest.mark.usefixtures("no_post_processing")
+def test_project_initialization(template_dir, project_config, initializer_factory):
     """Test basic project initialization."""
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.VITE, ViteTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.VITE, ViteTemplate)
 
     success = initializer.initialize_project(project_config)
     assert success
@@ -117,95 +126,29 @@ def test_project_initialization(template_dir, project_config):
     # Verify output directory structure
     output_dir = project_config.output_path
     assert output_dir.exists()
-    assert (output_dir / "src" / "main.js").exists()
-    assert (output_dir / "package.json").exists()
-    assert (output_dir / "index.html").exists()
+    # One directory walk instead of a stat per expected file
+    generated = {path.relative_to(output_dir).as_posix() for path in output_dir.rglob('*')}
+    assert {"src/main.js", "package.json", "index.html"} <= generated
 
     # Verify content replacement
-    main_content = (output_dir / "src" / "main.js").read_text()
-    assert "test-vite-app" in main_content
+    main_content = (output_dir / "src" / "main.js").read_bytes()
+    assert b"test-vite-app" in main_content
 
-    package_json = (output_dir / "package.json").read_text()
-    assert "test-vite-app" in package_json
+    package_json = (output_dir / "package.json").read_bytes()
+    assert b"test-vite-app" in package_json
     
-    html_content = (output_dir / "index.html").read_text()
-    assert "test-vite-app" in html_content
+    html_content = (output_dir / "index.html").read_bytes()
+    assert b"test-vite-app" in html_content
 
 
-def test_post_processing_execution(template_dir, project_config, temp_dir):
+@pytest.mark.parametrize('template_dir', [{'post_script': MARKER_SCRIPT}], indirect=True)
+def test_post_processing_execution(template_dir, project_config, fake_post_processing, initializer_factory):
     """Test that post-processing script is executed."""
-    # Create a test post-processing script that creates a marker file
-    config_path = template_dir / "vite" / "config.yml"
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
-
-    marker_path = temp_dir / "post_processing_executed"
-    config['post_processing']['script'] = f"""#!/bin/bash
-    touch {marker_path}
-    """
-
-    with open(config_path, 'w') as f:
-        yaml.dump(config, f)
-
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.VITE, ViteTemplate)
+    initializer = initializer_factory(template_dir, ProjectType.VITE, ViteTemplate)
 
     success = initializer.initialize_project(project_config)
     assert success
     assert initializer.wait_for_post_process_completed()
-    assert marker_path.exists()
-
-
-def test_config_file_loading(temp_dir):
-    """Test loading project configuration from JSON file."""
-    config_data = {
-        "name": "json-config-test",
-        "version": "1.0.0",
-        "description": "Test from JSON config",
-        "author": "Test Author",
-        "project_type": "vite",
-        "output_path": str(temp_dir / "output"),
-        "parameters": {
-            "typescript": True,
-            "framework": "vue"
-        }
-    }
-
-    config_file = temp_dir / "config.json"
-    with open(config_file, 'w') as f:
-        json.dump(config_data, f)
-
-    config = ProjectInitializer.load_config(config_file)
-    assert config.name == "json-config-test"
-    assert config.project_type == ProjectType.VITE
-    assert config.parameters["typescript"] is True
-    assert config.parameters["framework"] == "vue"
-
-
-def test_template_variable_replacement(template_dir, project_config):
-    """Test template variable replacement in file contents."""
-    test_file = template_dir / "vite" / "test.txt"
-    test_content = """
-    Project: ${KAVIA_TEMPLATE_PROJECT_NAME}
-    Author: {KAVIA_PROJECT_AUTHOR}
-    Version: ${KAVIA_PROJECT_VERSION}
-    Description: {KAVIA_PROJECT_DESCRIPTION}
-    """
-    test_file.write_text(test_content)
-
-    initializer = ProjectInitializer()
-    initializer.template_factory.template_provider = TemplateProvider(template_dir)
-    initializer.template_factory.register_template(ProjectType.VITE, ViteTemplate)
-
-    success = initializer.initialize_project(project_config)
-    assert success
-
-    output_file = project_config.output_path / "test.txt"
-    assert output_file.exists()
+    assert len(fake_post_processing) == 1
+    assert (project_config.output_path / "post_processing_executed").exists()
 
-    content = output_file.read_text()
-    assert project_config.name in content
-    assert project_config.author in content
-    assert project_config.version in content
-    assert project_config.description in content